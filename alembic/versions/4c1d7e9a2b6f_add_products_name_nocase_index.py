@@ -0,0 +1,30 @@
+"""Add case-insensitive product name index
+
+Revision ID: 4c1d7e9a2b6f
+Revises: e318e5c02e34
+Create Date: 2026-10-18 10:12:31.418205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1d7e9a2b6f"
+down_revision: Union[str, Sequence[str], None] = "e318e5c02e34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_products_name_nocase "
+        "ON products(name COLLATE NOCASE)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_products_name_nocase")
@@ -24,6 +24,11 @@ STARTUP_PRAGMAS = (
 )
 
 
+def _unicode_lower(value: Any) -> Any:
+    """SQL function ``unicode_lower``: SQLite's LOWER() only folds ASCII."""
+    return value.lower() if isinstance(value, str) else value
+
+
 class DatabaseManager:
     _connection = None
     _engine = None
@@ -72,6 +77,9 @@ class DatabaseManager:
             raw_conn = cls._engine.raw_connection()
             cls._connection = raw_conn.driver_connection
             cls._connection.row_factory = sqlite3.Row
+            cls._connection.create_function(
+                "unicode_lower", 1, _unicode_lower, deterministic=True
+            )
             cls._transaction_state.depth = 0
             cls.apply_startup_pragmas()
 
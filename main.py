@@ -1,5 +1,7 @@
+import importlib
 import sqlite3
 import sys
+import threading
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication, QMessageBox
@@ -7,7 +9,6 @@ from PySide6.QtWidgets import QApplication, QMessageBox
 from config import DATABASE_PATH
 from database import init_db
 from database.database_manager import DatabaseManager
-from ui.main_window import MainWindow
 from utils.decorators import handle_exceptions
 from utils.exceptions import AppException, DatabaseException
 from utils.system.logger import logger
@@ -145,6 +146,25 @@ def _warn_if_active_database_looks_empty(db_already_existed: bool) -> None:
         _show_startup_warning(warning_message)
 
 
+# Imported while the login dialog waits for the PIN; the main thread's later
+# import then resolves from sys.modules.
+PRELOAD_MODULES = ("ui.main_window",)
+
+
+def _preload_modules(module_names: tuple[str, ...]) -> threading.Thread:
+    def run():
+        for module_name in module_names:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                # The main thread imports the module again and reports errors.
+                logger.warning(f"Background import of {module_name} failed: {e}")
+
+    thread = threading.Thread(target=run, name="module-preload", daemon=True)
+    thread.start()
+    return thread
+
+
 class Application:
     @staticmethod
     @handle_exceptions(AppException, show_dialog=True)
@@ -183,12 +203,15 @@ if __name__ == "__main__":
 
         from ui.login_dialog import LoginDialog
 
+        _preload_modules(PRELOAD_MODULES)
         login = LoginDialog()
         if login.exec() != QDialog.DialogCode.Accepted:
             logger.info("Application closed due to failed authentication")
             sys.exit(0)
 
         # Run the main window setup and execution
+        from ui.main_window import MainWindow
+
         window = MainWindow()
         window.show()
         logger.info("Application started")
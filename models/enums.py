@@ -13,6 +13,12 @@ class InventoryAction(str, Enum):
     SET = "set"
 
 
+class BarcodeFilter(str, Enum):
+    ALL = "all"
+    WITH_BARCODE = "with_barcode"
+    WITHOUT_BARCODE = "without_barcode"
+
+
 class TimeInterval(str, Enum):
     DAY = "day"
     WEEK = "week"
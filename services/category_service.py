@@ -180,3 +180,6 @@ class CategoryService:
     def clear_cache():
         CategoryService.get_all_categories.cache_clear()
         logger.debug("Category cache cleared")
+
+
+category_service = CategoryService()
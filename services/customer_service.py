@@ -520,7 +520,7 @@ class CustomerService:
         WHERE (
             c.identifier_9 LIKE ?
             OR ci.identifier_3or4 LIKE ?
-            OR (c.name IS NOT NULL AND LOWER(c.name) LIKE LOWER(?))
+            OR (c.name IS NOT NULL AND c.name LIKE ?)
         )
         AND (? = 0 OR c.is_active = 1)
         """
@@ -2,7 +2,7 @@ from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from database.database_manager import DatabaseManager
-from models.enums import QUANTITY_PRECISION, InventoryAction
+from models.enums import QUANTITY_PRECISION, BarcodeFilter, InventoryAction
 from models.inventory import Inventory
 from services.audit_service import AuditService
 from utils.decorators import db_operation, handle_exceptions
@@ -21,6 +21,19 @@ from utils.validation.validators import (
     validate_string,
 )
 
+_INVENTORY_ITEM_SELECT = """
+    SELECT
+        i.product_id,
+        i.quantity,
+        p.name as product_name,
+        p.barcode,
+        p.category_id,
+        c.name as category_name
+    FROM inventory i
+    JOIN products p ON i.product_id = p.id
+    LEFT JOIN categories c ON p.category_id = c.id
+"""
+
 
 class InventoryService:
     @staticmethod
@@ -212,6 +225,96 @@ class InventoryService:
             logger.error(f"Error fetching inventory: {str(e)}")
             raise DatabaseException(f"Failed to fetch inventory: {str(e)}")
 
+    @staticmethod
+    @db_operation(show_dialog=True)
+    @handle_exceptions(DatabaseException, show_dialog=True)
+    def query_inventory(
+        category_id: Optional[int] = None,
+        barcode_mode: BarcodeFilter = BarcodeFilter.ALL,
+        search: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get inventory items matching the given filters.
+
+        Filtering is done by the database so only matching rows are returned.
+        Unlike `get_all_inventory`, missing barcodes and categories are `None`.
+
+        Args:
+            category_id: Only include products in this category, if given.
+            barcode_mode: Whether to include products with or without a barcode.
+            search: Case-insensitive substring matched on product name or barcode.
+
+        Returns:
+            List[Dict[str, Any]]: Matching inventory items ordered by product name.
+        """
+        filters = []
+        params: List[Any] = []
+
+        if category_id is not None:
+            filters.append("p.category_id = ?")
+            params.append(validate_integer(category_id, min_value=1))
+
+        barcode_mode = BarcodeFilter(barcode_mode)
+        if barcode_mode == BarcodeFilter.WITH_BARCODE:
+            filters.append("COALESCE(p.barcode, '') != ''")
+        elif barcode_mode == BarcodeFilter.WITHOUT_BARCODE:
+            filters.append("COALESCE(p.barcode, '') = ''")
+
+        if search and search.strip():
+            search_pattern = f"%{search.strip()}%"
+            # SQLite's LIKE is already case-insensitive for ASCII, so the columns
+            # are compared as stored instead of lowercasing every row per query.
+            filters.append("(p.name LIKE ? OR COALESCE(p.barcode, '') LIKE ?)")
+            params.extend([search_pattern] * 2)
+
+        where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
+        query = f"""
+            {_INVENTORY_ITEM_SELECT}
+            {where_clause}
+            ORDER BY p.name
+        """
+
+        try:
+            rows = DatabaseManager.fetch_all(query, tuple(params))
+            return [InventoryService._inventory_item_from_row(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error querying inventory: {str(e)}")
+            raise DatabaseException(f"Failed to query inventory: {str(e)}")
+
+    @staticmethod
+    @db_operation(show_dialog=True)
+    @handle_exceptions(DatabaseException, show_dialog=True)
+    def get_inventory_item(product_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a single inventory item in the same shape as `query_inventory`.
+
+        Args:
+            product_id: The product whose inventory row should be returned.
+
+        Returns:
+            Optional[Dict[str, Any]]: The inventory item, or None if it does not exist.
+        """
+        product_id = validate_integer(product_id, min_value=1)
+        query = f"""
+            {_INVENTORY_ITEM_SELECT}
+            WHERE i.product_id = ?
+        """
+        row = DatabaseManager.fetch_one(query, (product_id,))
+        if row is None:
+            return None
+        return InventoryService._inventory_item_from_row(row)
+
+    @staticmethod
+    def _inventory_item_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "product_id": row["product_id"],
+            "product_name": row["product_name"],
+            "category_id": row["category_id"],
+            "category_name": row["category_name"],
+            "quantity": float(row["quantity"]),
+            "barcode": row["barcode"] or None,
+        }
+
     @staticmethod
     @db_operation(show_dialog=True)
     @handle_exceptions(ValidationException, DatabaseException, show_dialog=True)
@@ -431,3 +534,6 @@ class InventoryService:
             extra={"count": len(products), "threshold": threshold},
         )
         return products
+
+
+inventory_service = InventoryService()
@@ -20,9 +20,33 @@ from utils.exceptions import (
     ValidationException,
 )
 from utils.system.event_system import event_system
-from utils.system.logger import logger
+from utils.system.logger import LogLevel, logger
 from utils.validation.validators import validate_integer, validate_string
 
+# Shared WHERE clause for the paged product catalog (see get_products_page).
+# Text is lowered with unicode_lower, like ProductFilterProxyModel lowers it
+# in Python, so "piña" also matches "PIÑA".
+_CATALOG_WHERE = """
+WHERE (:active_only = 0 OR p.is_active = 1)
+AND (:category_id IS NULL OR p.category_id = :category_id)
+AND (
+    :search_pattern IS NULL
+    OR unicode_lower(p.name) LIKE :search_pattern ESCAPE '\\'
+    OR unicode_lower(COALESCE(p.description, '')) LIKE :search_pattern ESCAPE '\\'
+)
+"""
+
+
+def _contains_pattern(search_term: str) -> str:
+    """Build a LIKE pattern matching the lowered term literally, anywhere."""
+    escaped = (
+        search_term.lower()
+        .replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    )
+    return f"%{escaped}%"
+
 
 class ProductService:
     @db_operation(show_dialog=True)
@@ -259,9 +283,9 @@ class ProductService:
         FROM products p
         LEFT JOIN categories c ON p.category_id = c.id
         WHERE (
-            LOWER(p.name) LIKE LOWER(:search_pattern)
-            OR LOWER(COALESCE(p.description, '')) LIKE LOWER(:search_pattern)
-            OR LOWER(COALESCE(p.barcode, '')) LIKE LOWER(:search_pattern)
+            p.name LIKE :search_pattern
+            OR COALESCE(p.description, '') LIKE :search_pattern
+            OR COALESCE(p.barcode, '') LIKE :search_pattern
         )
         AND (:active_only = 0 OR p.is_active = 1)
         ORDER BY p.name
@@ -278,6 +302,118 @@ class ProductService:
         )
         return products
 
+    @staticmethod
+    def _catalog_filter(
+        search_term: str, category_id: Optional[int], active_only: bool
+    ) -> Dict[str, Any]:
+        return {
+            "search_pattern": _contains_pattern(search_term) if search_term else None,
+            "category_id": category_id,
+            "active_only": 1 if active_only else 0,
+        }
+
+    @db_operation(show_dialog=True)
+    @handle_exceptions(DatabaseException, show_dialog=True)
+    def count_products(
+        self,
+        search_term: str = "",
+        category_id: Optional[int] = None,
+        active_only: bool = True,
+    ) -> int:
+        """Count the products matching the catalog filters."""
+        search_term = validate_string(search_term, max_length=100)
+        row = DatabaseManager.fetch_one(
+            f"SELECT COUNT(*) AS total FROM products p {_CATALOG_WHERE}",
+            self._catalog_filter(search_term, category_id, active_only),
+        )
+        return int(row["total"]) if row else 0
+
+    @db_operation(show_dialog=True)
+    @handle_exceptions(DatabaseException, show_dialog=True)
+    def get_products_page(
+        self,
+        after_id: int,
+        limit: int,
+        search_term: str = "",
+        category_id: Optional[int] = None,
+        active_only: bool = True,
+    ) -> List[Product]:
+        """
+        Get one page of products matching the catalog filters, ordered by ID.
+
+        Pages are keyed on the last ID seen rather than an OFFSET, so SQLite
+        seeks straight to the page through the primary key and rows archived
+        while scrolling do not shift later pages.
+
+        Args:
+            after_id: Only return products with a greater ID (0 for the start).
+            limit: Maximum number of products to return.
+            search_term: Case-insensitive name or description fragment.
+            category_id: Only return products in this category, if given.
+            active_only: Whether to leave out archived products.
+
+        Returns:
+            List[Product]: The requested page.
+
+        Raises:
+            DatabaseException: If database operation fails.
+        """
+        after_id = validate_integer(after_id, min_value=0)
+        limit = validate_integer(limit, min_value=1)
+        search_term = validate_string(search_term, max_length=100)
+        query = f"""
+        SELECT p.*, c.name as category_name
+        FROM products p
+        LEFT JOIN categories c ON p.category_id = c.id
+        {_CATALOG_WHERE}
+        AND p.id > :after_id
+        ORDER BY p.id
+        LIMIT :limit
+        """
+        params = self._catalog_filter(search_term, category_id, active_only)
+        params.update({"limit": limit, "after_id": after_id})
+        rows = DatabaseManager.fetch_all(query, params)
+        products = [Product.from_db_row(row) for row in rows]
+        logger.debug(
+            "Product page retrieved",
+            extra={"after_id": after_id, "limit": limit, "count": len(products)},
+        )
+        return products
+
+    @db_operation(show_dialog=True)
+    @handle_exceptions(DatabaseException, show_dialog=True)
+    def get_product_names(
+        self, search_term: str, limit: int, active_only: bool = True
+    ) -> List[str]:
+        """
+        Get up to `limit` product names containing `search_term`, sorted by name.
+
+        Only the name column is read, so search suggestions stay cheap
+        however large the catalog is.
+
+        Raises:
+            DatabaseException: If database operation fails.
+        """
+        search_term = validate_string(search_term, max_length=100)
+        limit = validate_integer(limit, min_value=1)
+        query = """
+        SELECT p.name
+        FROM products p
+        WHERE unicode_lower(p.name) LIKE :search_pattern ESCAPE '\\'
+        AND (:active_only = 0 OR p.is_active = 1)
+        ORDER BY p.name
+        LIMIT :limit
+        """
+        rows = DatabaseManager.fetch_all(
+            query,
+            {
+                "search_pattern": _contains_pattern(search_term),
+                "active_only": 1 if active_only else 0,
+                "limit": limit,
+            },
+        )
+        return [row["name"] for row in rows]
+
     @db_operation(show_dialog=True)
     @handle_exceptions(DatabaseException, show_dialog=True)
     def get_product_by_barcode(
@@ -295,9 +431,9 @@ class ProductService:
         try:
             row = DatabaseManager.fetch_one(query, (barcode, 1 if active_only else 0))
             if row:
-                logger.debug(f"Found product row: {row}")
                 product = Product.from_db_row(row)
-                logger.debug(f"Created product object: {vars(product)}")
+                if logger.isEnabledFor(LogLevel.DEBUG):
+                    logger.debug(f"Created product object: {vars(product)}")
                 return product
             return None
         except Exception as e:
@@ -498,3 +634,8 @@ class ProductService:
             raise ValidationException(
                 f"Barcode {barcode} is already in use by product: {existing_product.name}"
             )
+
+
+# get_all_products' lru_cache is keyed on self, so views and services share
+# this instance instead of each evicting the others' cached catalogs.
+product_service = ProductService()
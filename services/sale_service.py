@@ -7,9 +7,9 @@ from models.enums import MAX_SALE_ITEMS, QUANTITY_PRECISION
 from models.sale import Sale, SaleItem
 from services.audit_service import AuditService
 from services.customer_service import CustomerService
-from services.inventory_service import InventoryService
+from services.inventory_service import InventoryService, inventory_service
 from services.mutation_coordinator import MutationCoordinator
-from services.product_service import ProductService
+from services.product_service import product_service
 from services.receipt_service import ReceiptService
 from utils.decorators import db_operation, handle_exceptions
 from utils.exceptions import DatabaseException, NotFoundException, ValidationException
@@ -26,9 +26,9 @@ from utils.validation.validators import (
 
 class SaleService:
     def __init__(self):
-        self.inventory_service = InventoryService()
+        self.inventory_service = inventory_service
         self.customer_service = CustomerService()
-        self.product_service = ProductService()
+        self.product_service = product_service
         self.receipt_service = ReceiptService()
 
     @db_operation(show_dialog=True)
@@ -214,3 +214,16 @@ def test_init_db_migrates_legacy_soft_delete_columns_without_losing_data(tmp_pat
         assert product_index is not None
     finally:
         _close_db_connection()
+
+
+def test_init_db_creates_case_insensitive_product_name_index(tmp_path):
+    """Migrations should add the NOCASE index used by inventory name filtering."""
+    db_path = tmp_path / "nocase_index.db"
+
+    try:
+        init_db(str(db_path))
+
+        assert _fetch_index("idx_products_name_nocase") is not None
+        assert _fetch_index("idx_products_category") is not None
+    finally:
+        _close_db_connection()
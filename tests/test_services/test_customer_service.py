@@ -147,6 +147,8 @@ class TestCustomerService:
         assert customer_service.search_customers("Test") == []
         results = customer_service.search_customers("Test", active_only=False)
         assert [customer.id for customer in results] == [customer_id]
+        results = customer_service.search_customers("test cu", active_only=False)
+        assert [customer.id for customer in results] == [customer_id]
 
     def test_get_customer_purchase_history(
         self, customer_service, sample_customer_data
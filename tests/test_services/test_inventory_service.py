@@ -2,7 +2,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from models.enums import BarcodeFilter
+from services.category_service import CategoryService
 from services.inventory_service import InventoryService
+from services.product_service import ProductService
 from utils.exceptions import ValidationException
 
 
@@ -68,3 +71,66 @@ class TestInventoryServiceUpdates:
             {"product_id": 5, "quantity": 2.5}
         ) == (5, 2.5)
         assert InventoryService._normalize_batch_item(item) == (9, 1.25)
+
+
+class TestInventoryServiceQuery:
+    @pytest.fixture
+    def seeded_products(self, db_manager):
+        category_id = CategoryService.create_category("Bebidas")
+        product_service = ProductService()
+        with_barcode = product_service.create_product(
+            {
+                "name": "Jugo Naranja",
+                "cost_price": 500,
+                "sell_price": 800,
+                "category_id": category_id,
+                "barcode": "7801234567890",
+            }
+        )
+        without_barcode = product_service.create_product(
+            {"name": "Pan Amasado", "cost_price": 100, "sell_price": 200}
+        )
+        return category_id, with_barcode, without_barcode
+
+    def test_query_inventory_filters_by_category(self, seeded_products):
+        category_id, with_barcode, _ = seeded_products
+
+        items = InventoryService.query_inventory(category_id=category_id)
+
+        assert [item["product_id"] for item in items] == [with_barcode]
+
+    def test_query_inventory_filters_by_barcode_presence(self, seeded_products):
+        _, with_barcode, without_barcode = seeded_products
+
+        with_items = InventoryService.query_inventory(
+            barcode_mode=BarcodeFilter.WITH_BARCODE
+        )
+        without_items = InventoryService.query_inventory(
+            barcode_mode=BarcodeFilter.WITHOUT_BARCODE
+        )
+
+        assert [item["product_id"] for item in with_items] == [with_barcode]
+        assert [item["product_id"] for item in without_items] == [without_barcode]
+        assert without_items[0]["barcode"] is None
+        assert without_items[0]["category_name"] is None
+
+    def test_query_inventory_matches_name_or_barcode_case_insensitively(
+        self, seeded_products
+    ):
+        _, with_barcode, without_barcode = seeded_products
+
+        by_name = InventoryService.query_inventory(search="pan")
+        by_barcode = InventoryService.query_inventory(search="4567")
+
+        assert [item["product_id"] for item in by_name] == [without_barcode]
+        assert [item["product_id"] for item in by_barcode] == [with_barcode]
+
+    def test_get_inventory_item_returns_single_row(self, seeded_products):
+        category_id, with_barcode, _ = seeded_products
+
+        item = InventoryService.get_inventory_item(with_barcode)
+
+        assert item["product_id"] == with_barcode
+        assert item["category_id"] == category_id
+        assert item["barcode"] == "7801234567890"
+        assert InventoryService.get_inventory_item(999999) is None
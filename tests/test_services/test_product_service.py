@@ -7,6 +7,7 @@ from services.category_service import CategoryService
 from services.customer_service import CustomerService
 from services.inventory_service import InventoryService
 from services.product_service import ProductService
+from services.product_service import product_service as shared_product_service
 from services.product_service_support import (
     build_product_update_statement,
     normalize_create_product_data,
@@ -323,6 +324,137 @@ class TestProductServiceContracts:
         results = product_service.search_products("Archived", active_only=False)
         assert [product.id for product in results] == [product_id]
 
+    def test_search_products_ignores_case_in_sql(self, product_service):
+        product_id = product_service.create_product(
+            {
+                "name": "LECHE Entera",
+                "cost_price": 500,
+                "sell_price": 800,
+                "barcode": "123456789016",
+            }
+        )
+
+        for term in ("leche", "ENTERA", "56789016"):
+            results = product_service.search_products(term)
+            assert [product.id for product in results] == [product_id]
+
+    def test_get_all_products_joins_category_names_in_one_query(
+        self, product_service, mocker
+    ):
+        category_id = CategoryService.create_category("Congelados")
+        for name in ("Helado", "Pizza"):
+            product_service.create_product(
+                {
+                    "name": name,
+                    "category_id": category_id,
+                    "cost_price": 500,
+                    "sell_price": 800,
+                }
+            )
+        product_service.clear_cache()
+        fetch_all_spy = mocker.spy(DatabaseManager, "fetch_all")
+        fetch_one_spy = mocker.spy(DatabaseManager, "fetch_one")
+
+        products = product_service.get_all_products()
+
+        assert [product.category_name for product in products] == [
+            "Congelados",
+            "Congelados",
+        ]
+        assert fetch_all_spy.call_count == 1
+        assert fetch_one_spy.call_count == 0
+
+    def test_get_products_page_filters_and_pages_in_sql(self, product_service):
+        category_id = CategoryService.create_category("Lácteos")
+        ids = [
+            product_service.create_product(
+                {
+                    "name": f"Leche {index}",
+                    "category_id": category_id,
+                    "cost_price": 500,
+                    "sell_price": 800,
+                }
+            )
+            for index in range(3)
+        ]
+        product_service.create_product(
+            {
+                "name": "Pan",
+                "description": "Leche y harina",
+                "cost_price": 50,
+                "sell_price": 100,
+            }
+        )
+        product_service.delete_product(ids[2])
+
+        assert product_service.count_products("leche") == 3
+        assert product_service.count_products("leche", category_id) == 2
+        assert product_service.count_products("leche", category_id, False) == 3
+        page = product_service.get_products_page(ids[0], 2, "LECHE")
+        assert [product.name for product in page] == ["Leche 1", "Pan"]
+        assert page[0].category_name == "Lácteos"
+
+    def test_catalog_search_folds_non_ascii_case(self, product_service):
+        pina_id = product_service.create_product(
+            {"name": "PIÑA COLADA", "cost_price": 500, "sell_price": 800}
+        )
+        arbol_id = product_service.create_product(
+            {
+                "name": "Adorno",
+                "description": "Árbol de Navidad",
+                "cost_price": 500,
+                "sell_price": 800,
+            }
+        )
+
+        assert product_service.count_products("piña") == 1
+        assert [p.id for p in product_service.get_products_page(0, 10, "piña")] == [
+            pina_id
+        ]
+        assert [p.id for p in product_service.get_products_page(0, 10, "árbol")] == [
+            arbol_id
+        ]
+
+    def test_catalog_search_matches_like_wildcards_literally(self, product_service):
+        for name in ("Descuento 10%", "Descuento 100"):
+            product_service.create_product(
+                {"name": name, "cost_price": 500, "sell_price": 800}
+            )
+
+        names = [p.name for p in product_service.get_products_page(0, 10, "10%")]
+        assert names == ["Descuento 10%"]
+        assert product_service.count_products("%") == 1
+
+    def test_get_product_names_matches_names_only_up_to_limit(self, product_service):
+        for name in ("Leche Descremada", "Leche Entera", "Pan", "Queso"):
+            product_service.create_product(
+                {"name": name, "description": "leche", "cost_price": 1, "sell_price": 2}
+            )
+        archived_id = product_service.create_product(
+            {"name": "Leche Chocolate", "cost_price": 1, "sell_price": 2}
+        )
+        product_service.delete_product(archived_id)
+
+        assert product_service.get_product_names("LECHE", 5) == [
+            "Leche Descremada",
+            "Leche Entera",
+        ]
+        assert product_service.get_product_names("leche", 1, active_only=False) == [
+            "Leche Chocolate"
+        ]
+
+    def test_get_product_names_folds_non_ascii_case(self, product_service):
+        for name in ("PIÑA COLADA", "Piñata", "Descuento 10%", "Descuento 100"):
+            product_service.create_product(
+                {"name": name, "cost_price": 1, "sell_price": 2}
+            )
+
+        assert product_service.get_product_names("piña", 5) == [
+            "PIÑA COLADA",
+            "Piñata",
+        ]
+        assert product_service.get_product_names("10%", 5) == ["Descuento 10%"]
+
     def test_create_product_emits_product_and_inventory_events_once(
         self, product_service
     ):
@@ -405,3 +537,12 @@ class TestProductServiceContracts:
             assert payloads == [product_id]
         finally:
             event_system.product_updated.disconnect(handler)
+
+    def test_sale_service_reuses_shared_product_service_cache(self, sale_service):
+        shared_product_service.clear_cache()
+
+        assert sale_service.product_service is shared_product_service
+        assert (
+            shared_product_service.get_all_products()
+            is shared_product_service.get_all_products()
+        )
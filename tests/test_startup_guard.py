@@ -1,4 +1,5 @@
 import sqlite3
+import threading
 from pathlib import Path
 
 import main
@@ -55,3 +56,21 @@ def test_warn_if_active_database_looks_empty_shows_warning_for_existing_database
 
     build_warning_mock.assert_called_once_with(True)
     show_warning_mock.assert_called_once_with(warning_message)
+
+
+def test_preload_modules_imports_in_background(mocker):
+    import_mock = mocker.patch("main.importlib.import_module")
+
+    thread = main._preload_modules(("ui.main_window",))
+    thread.join(timeout=5)
+
+    assert thread is not threading.current_thread()
+    import_mock.assert_called_once_with("ui.main_window")
+
+
+def test_preload_modules_logs_import_failures(mocker):
+    warning_mock = mocker.patch("main.logger.warning")
+
+    main._preload_modules(("missing_module_for_preload",)).join(timeout=5)
+
+    warning_mock.assert_called_once()
@@ -137,6 +137,20 @@ class TestLogger:
         assert any(log["level"] == "ERROR" for log in logs)
         assert any(log["level"] == "CRITICAL" for log in logs)
 
+    def test_disabled_levels_skip_message_formatting(self, configured_logger, mocker):
+        """Messages below the logger level are dropped before being encoded."""
+        format_spy = mocker.spy(configured_logger, "_format_message")
+
+        configured_logger.debug("Debug message", extra={"row": 1})
+
+        assert not configured_logger.isEnabledFor(logging.DEBUG)
+        assert configured_logger.isEnabledFor(logging.INFO)
+        assert format_spy.call_count == 0
+
+        configured_logger.info("Info message")
+
+        assert format_spy.call_count == 1
+
     def test_log_rotation(self, configured_logger, logger_test_dir):
         """Test log file rotation."""
         # Write enough logs to trigger rotation
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 not installed")
+
+from PySide6.QtCore import QSettings
+
+from utils.system.settings import CachedSettings
+
+ORGANIZATION = "BillingInventoryTests"
+APPLICATION = "CachedSettingsTest"
+
+
+@pytest.fixture
+def backing_settings():
+    settings = QSettings(ORGANIZATION, APPLICATION)
+    settings.clear()
+    yield settings
+    settings.clear()
+    settings.sync()
+
+
+def test_cached_settings_defers_writes_until_flush(backing_settings):
+    settings = CachedSettings(ORGANIZATION, APPLICATION)
+
+    settings.setValue("LastTabIndex", 3)
+
+    assert settings.value("LastTabIndex", 0) == 3
+    assert backing_settings.value("LastTabIndex") is None
+
+    settings.flush()
+    backing_settings.sync()
+
+    assert int(backing_settings.value("LastTabIndex")) == 3
+
+
+def test_cached_settings_reads_backing_store_once(backing_settings, mocker):
+    backing_settings.setValue("WindowSize", 42)
+    backing_settings.sync()
+    settings = CachedSettings(ORGANIZATION, APPLICATION)
+    read_spy = mocker.spy(settings._settings, "value")
+
+    assert int(settings.value("WindowSize")) == 42
+    assert int(settings.value("WindowSize")) == 42
+    assert settings.value("Missing", "default") == "default"
+
+    assert read_spy.call_count == 2
+
+
+def test_cached_settings_skips_writes_of_unchanged_values(backing_settings, mocker):
+    backing_settings.setValue("WindowPosition", 100)
+    backing_settings.sync()
+    settings = CachedSettings(ORGANIZATION, APPLICATION)
+    restored = settings.value("WindowPosition")
+    sync_spy = mocker.spy(settings._settings, "sync")
+
+    settings.setValue("WindowPosition", restored)
+    settings.flush()
+
+    assert sync_spy.call_count == 0
@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 not installed")
+
+from PySide6.QtWidgets import QMessageBox
+
+from services.category_service import CategoryService
+from ui.category_management_dialog import CategoryManagementDialog
+from utils.system.event_system import event_system
+
+
+def test_delete_category_emits_category_deleted_once(qtbot, db_manager, mocker):
+    CategoryService.clear_cache()
+    category_id = CategoryService().create_category("Bebidas")
+    dialog = CategoryManagementDialog()
+    qtbot.addWidget(dialog)
+    mocker.patch("ui.category_management_dialog.show_info_message")
+    mocker.patch(
+        "ui.category_management_dialog.QMessageBox.question",
+        return_value=QMessageBox.StandardButton.Yes,
+    )
+    dialog.category_list.setCurrentRow(0)
+    payloads = []
+
+    def handler(payload=None):
+        payloads.append(payload)
+
+    event_system.category_deleted.connect(handler)
+    try:
+        dialog.delete_category()
+    finally:
+        event_system.category_deleted.disconnect(handler)
+
+    assert payloads == [category_id]
+    assert dialog.category_list.count() == 0
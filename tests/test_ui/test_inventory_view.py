@@ -2,8 +2,11 @@ import pytest
 
 pytest.importorskip("PySide6", reason="PySide6 not installed")
 
+from PySide6.QtCore import Qt
+
+from services.category_service import CategoryService
 from services.product_service import ProductService
-from ui.inventory_view import InventoryView
+from ui.inventory_view import EditInventoryDialog, InventoryView
 from utils.system.event_system import event_system
 
 
@@ -17,6 +20,13 @@ def capture_signal(signal):
     return payloads, handler
 
 
+def _create_view(qtbot):
+    view = InventoryView()
+    qtbot.addWidget(view)
+    qtbot.waitUntil(lambda: not view.is_loading, timeout=2000)
+    return view
+
+
 def test_edit_inventory_does_not_reemit_inventory_events(qtbot, db_manager, mocker):
     product_id = ProductService().create_product(
         {
@@ -38,8 +48,7 @@ def test_edit_inventory_does_not_reemit_inventory_events(qtbot, db_manager, mock
         def get_data(self):
             return {"adjustment": 1.5, "reason": "conteo"}
 
-    view = InventoryView()
-    qtbot.addWidget(view)
+    view = _create_view(qtbot)
     item = next(
         entry for entry in view.current_inventory if entry["product_id"] == product_id
     )
@@ -70,3 +79,221 @@ def test_edit_inventory_does_not_reemit_inventory_events(qtbot, db_manager, mock
     finally:
         event_system.inventory_changed.disconnect(changed_handler)
         event_system.inventory_updated.disconnect(updated_handler)
+
+
+def test_inventory_table_is_served_by_model(qtbot, db_manager):
+    product_id = ProductService().create_product(
+        {
+            "name": "Producto Sin Código",
+            "description": "Prueba de modelo",
+            "cost_price": 100,
+            "sell_price": 200,
+        }
+    )
+
+    view = _create_view(qtbot)
+
+    rows = {
+        view.inventory_proxy.index(row, 0).data(Qt.ItemDataRole.EditRole): row
+        for row in range(view.inventory_proxy.rowCount())
+    }
+    row = rows[product_id]
+    assert view.inventory_proxy.index(row, 1).data() == "Producto Sin Código"
+    assert view.inventory_proxy.index(row, 2).data() == "Sin Categoría"
+    assert view.inventory_proxy.index(row, 3).data() == "Sin Código"
+    assert view.inventory_proxy.index(row, 5).data() == "Editar"
+    assert view._item_at(row)["product_id"] == product_id
+
+
+def test_filter_changes_are_debounced_into_one_reload(qtbot, db_manager, mocker):
+    view = _create_view(qtbot)
+    query_spy = mocker.spy(view.inventory_service, "query_inventory")
+
+    view.barcode_filter.setCurrentIndex(1)
+    view.barcode_filter.setCurrentIndex(2)
+    view.search_input.setText("pan")
+
+    assert query_spy.call_count == 0
+    qtbot.waitUntil(lambda: query_spy.call_count == 1, timeout=1000)
+    qtbot.wait(300)
+    assert query_spy.call_count == 1
+    assert query_spy.call_args.kwargs["search"] == "pan"
+    qtbot.waitUntil(lambda: not view.is_loading, timeout=2000)
+
+
+def test_barcode_scan_opens_matching_item(qtbot, db_manager, mocker):
+    product_id = ProductService().create_product(
+        {
+            "name": "Producto Escaneado",
+            "cost_price": 100,
+            "sell_price": 200,
+            "barcode": "7809876543210",
+        }
+    )
+    view = _create_view(qtbot)
+    edit_mock = mocker.patch.object(view, "edit_inventory")
+
+    view.barcode_input.setText("7809876543210")
+    view.handle_barcode_scan()
+
+    edit_mock.assert_called_once()
+    assert edit_mock.call_args.args[0]["product_id"] == product_id
+    assert view.barcode_input.text() == ""
+
+
+def test_inventory_change_patches_only_the_changed_row(qtbot, db_manager, mocker):
+    product_id = ProductService().create_product(
+        {"name": "Producto Parcheado", "cost_price": 100, "sell_price": 200}
+    )
+    view = _create_view(qtbot)
+    query_spy = mocker.spy(view.inventory_service, "query_inventory")
+
+    view.inventory_service.update_quantity(product_id, 4)
+
+    row = next(
+        row
+        for row in range(view.inventory_proxy.rowCount())
+        if view.inventory_proxy.index(row, 0).data(Qt.ItemDataRole.EditRole)
+        == product_id
+    )
+    assert view.inventory_proxy.index(row, 4).data() == "4.000"
+    assert view._by_product_id[product_id]["quantity"] == 4.0
+    assert query_spy.call_count == 0
+    view.cleanup()
+
+
+def test_actions_delegate_click_opens_editor(qtbot, db_manager, mocker):
+    product_id = ProductService().create_product(
+        {"name": "Producto Delegado", "cost_price": 100, "sell_price": 200}
+    )
+    view = _create_view(qtbot)
+    view.resize(900, 400)
+    view.show()
+    qtbot.waitExposed(view)
+    edit_mock = mocker.patch.object(view, "edit_inventory")
+
+    row = next(
+        row
+        for row in range(view.inventory_proxy.rowCount())
+        if view.inventory_proxy.index(row, 0).data(Qt.ItemDataRole.EditRole)
+        == product_id
+    )
+    cell_rect = view.inventory_table.visualRect(view.inventory_proxy.index(row, 5))
+    qtbot.mouseClick(
+        view.inventory_table.viewport(),
+        Qt.MouseButton.LeftButton,
+        pos=cell_rect.center(),
+    )
+
+    edit_mock.assert_called_once()
+    assert edit_mock.call_args.args[0]["product_id"] == product_id
+
+
+def test_category_combo_follows_category_events(qtbot, db_manager, mocker):
+    first_id = CategoryService.create_category("Lácteos")
+    view = _create_view(qtbot)
+    view.category_filter.setCurrentIndex(view.category_filter.findData(first_id))
+    set_model_spy = mocker.spy(view.category_filter, "setModel")
+    index_changed_spy = mocker.Mock()
+    view.category_filter.currentIndexChanged.connect(index_changed_spy)
+
+    view.load_categories()
+    assert set_model_spy.call_count == 0
+
+    second_id = CategoryService.create_category("Abarrotes")
+
+    # One model swap per rebuild, with no index-change cascade.
+    assert set_model_spy.call_count == 1
+    assert index_changed_spy.call_count == 0
+    assert view.category_filter.findData(second_id) >= 0
+    assert view.category_filter.currentData() == first_id
+    view.cleanup()
+
+
+def test_edit_selected_item_resolves_row_after_sorting(qtbot, db_manager, mocker):
+    product_service = ProductService()
+    first_id = product_service.create_product(
+        {"name": "Alfa", "cost_price": 100, "sell_price": 200}
+    )
+    second_id = product_service.create_product(
+        {"name": "Beta", "cost_price": 100, "sell_price": 200}
+    )
+    view = _create_view(qtbot)
+    edit_mock = mocker.patch.object(view, "edit_inventory")
+
+    view.inventory_table.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+    view.inventory_table.selectRow(0)
+    view.edit_selected_item()
+
+    assert view.inventory_proxy.index(0, 1).data() == "Beta"
+    edit_mock.assert_called_once_with(view._by_product_id[second_id])
+    assert first_id in view._by_product_id
+
+
+def test_fast_inventory_load_does_not_touch_the_cursor(qtbot, db_manager, mocker):
+    view = _create_view(qtbot)
+    set_cursor = mocker.patch("ui.inventory_view.QApplication.setOverrideCursor")
+    restore_cursor = mocker.patch(
+        "ui.inventory_view.QApplication.restoreOverrideCursor"
+    )
+
+    view.refresh()
+    qtbot.waitUntil(lambda: not view.is_loading, timeout=2000)
+
+    set_cursor.assert_not_called()
+    restore_cursor.assert_not_called()
+    assert not view._busy_cursor_timer.isActive()
+
+
+def test_superseded_inventory_results_are_dropped(qtbot, db_manager):
+    view = _create_view(qtbot)
+    view._load_seq += 2
+    stale_request = view._load_seq - 1
+
+    view._on_inventory_loaded(stale_request, [{"product_id": 99}])
+
+    assert 99 not in view._by_product_id
+    assert view.is_loading
+    view._cancel_pending_loads()
+    assert not view.is_loading
+
+
+def test_edit_dialog_is_reused_between_items(qtbot, db_manager, mocker):
+    product_service = ProductService()
+    first_id = product_service.create_product(
+        {
+            "name": "Primero",
+            "cost_price": 100,
+            "sell_price": 200,
+            "barcode": "7800000000011",
+        }
+    )
+    second_id = product_service.create_product(
+        {"name": "Segundo", "cost_price": 100, "sell_price": 200}
+    )
+    view = _create_view(qtbot)
+    mocker.patch.object(EditInventoryDialog, "exec", return_value=0)
+
+    view.edit_inventory(view._by_product_id[first_id])
+    dialog = view._edit_dialog
+    dialog.adjustment_input.setValue(5)
+    dialog.reason_input.setText("conteo")
+    view.edit_inventory(view._by_product_id[second_id])
+
+    assert view._edit_dialog is dialog
+    assert dialog.windowTitle() == "Editar Segundo"
+    assert dialog.adjustment_input.value() == 0
+    assert dialog.reason_input.text() == ""
+    assert not dialog.form_layout.isRowVisible(dialog.barcode_label)
+
+
+def test_edit_dialog_previews_new_quantity(qtbot):
+    dialog = EditInventoryDialog(
+        {"product_id": 1, "product_name": "Arroz", "quantity": 2.5, "barcode": None}
+    )
+    qtbot.addWidget(dialog)
+
+    dialog.adjustment_input.setValue(1.25)
+
+    assert dialog.new_quantity_label.text() == "3.750"
+    assert not dialog.adjustment_input.keyboardTracking()
@@ -0,0 +1,87 @@
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 not installed")
+
+from PySide6.QtCore import QSortFilterProxyModel, Qt
+
+from ui.inventory_view_tables import (
+    ACTION_LABELS_ROLE,
+    INVENTORY_ACTIONS,
+    InventoryTableModel,
+)
+
+
+def _rows():
+    return [
+        {
+            "product_id": 1,
+            "product_name": "Arroz",
+            "category_name": "Abarrotes",
+            "barcode": "780001",
+            "quantity": 12.0,
+        },
+        {
+            "product_id": 2,
+            "product_name": "Pan",
+            "category_name": None,
+            "barcode": None,
+            "quantity": 3.5,
+        },
+    ]
+
+
+def test_inventory_model_applies_display_fallbacks():
+    model = InventoryTableModel()
+    model.set_rows(_rows())
+
+    assert model.rowCount() == 2
+    assert model.index(1, 2).data() == "Sin Categoría"
+    assert model.index(1, 3).data() == "Sin Código"
+    assert model.index(0, 4).data() == "12.000"
+    assert model.index(0, 4).data(Qt.ItemDataRole.EditRole) == 12.0
+    assert model.headerData(4, Qt.Orientation.Horizontal) == "Cantidad"
+    assert model.index(0, 5).data(ACTION_LABELS_ROLE) == INVENTORY_ACTIONS
+
+
+def test_inventory_model_rows_map_through_sorting_proxy():
+    model = InventoryTableModel()
+    model.set_rows(_rows())
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setSortRole(Qt.ItemDataRole.EditRole)
+
+    proxy.sort(4, Qt.SortOrder.AscendingOrder)
+    source_row = proxy.mapToSource(proxy.index(0, 0)).row()
+
+    assert model.row_data(source_row)["product_name"] == "Pan"
+    assert model.row_data(5) is None
+
+
+def test_inventory_model_update_item_patches_row_in_place():
+    rows = _rows()
+    model = InventoryTableModel()
+    model.set_rows(rows)
+    changed = []
+    model.dataChanged.connect(lambda top, bottom: changed.append(top.row()))
+
+    assert model.update_item({"product_id": 2, "quantity": 8.0}) is True
+    assert model.update_item({"product_id": 99, "quantity": 1.0}) is False
+
+    assert rows[1]["quantity"] == 8.0
+    assert model.index(1, 4).data() == "8.000"
+    assert changed == [1]
+
+
+def test_inventory_proxy_sorts_quantity_numerically():
+    model = InventoryTableModel()
+    rows = _rows()
+    rows[0]["quantity"] = 100.0
+    rows[1]["quantity"] = 9.0
+    model.set_rows(rows)
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setSortRole(Qt.ItemDataRole.EditRole)
+
+    proxy.sort(4, Qt.SortOrder.AscendingOrder)
+
+    assert [proxy.index(row, 4).data() for row in range(2)] == ["9.000", "100.000"]
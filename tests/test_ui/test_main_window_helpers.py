@@ -2,18 +2,22 @@ import pytest
 
 pytest.importorskip("PySide6", reason="PySide6 not installed")
 
+import threading
 from types import SimpleNamespace
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QMessageBox
 
 from ui.main_window import (
     AUDIT_TAB,
     CUSTOMER_REFRESH_TARGETS,
+    INVENTORY_TAB,
     PRODUCT_REFRESH_TARGETS,
     PURCHASE_REFRESH_TARGETS,
     MainWindow,
     build_backup_skipped_status_message,
 )
+from utils.exceptions import UIException
 from utils.system.event_system import event_system
 
 
@@ -50,6 +54,44 @@ def test_main_window_includes_audit_tab(qtbot, db_manager, allow_main_window_clo
     assert "Auditoría" in tab_names
 
 
+def test_main_window_builds_tab_views_on_first_use(
+    qtbot, db_manager, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+
+    current_name = window.tab_widget.tabText(window.tab_widget.currentIndex())
+    assert list(window.views_by_name) == [current_name]
+
+    target_index = 2 if window.tab_widget.currentIndex() != 2 else 1
+    target_name = window.tab_widget.tabText(target_index)
+    window.switch_to_tab(target_index)
+
+    view = window.views_by_name[target_name]
+    assert window.tab_widget.widget(target_index) is view
+    assert window.tab_widget.currentIndex() == target_index
+    assert window.tab_widget.tabText(target_index) == target_name
+    assert window.ensure_tab_view(target_index) is view
+
+
+def test_failed_tab_view_creation_can_be_retried(
+    qtbot, db_manager, mocker, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    index = 7 if window.tab_widget.currentIndex() != 7 else 6
+    view_class = window._tab_factories[index]
+    window._tab_factories[index] = mocker.Mock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(UIException):
+        window.ensure_tab_view(index)
+
+    assert window.tab_widget.tabText(index) not in window.views_by_name
+    window._tab_factories[index] = view_class
+    view = window.ensure_tab_view(index)
+    assert isinstance(view, view_class)
+
+
 def test_main_window_refreshes_once_for_customer_add(
     qtbot, db_manager, mocker, allow_main_window_close
 ):
@@ -71,7 +113,7 @@ def test_main_window_refreshes_once_for_customer_add(
 
     window = MainWindow()
     qtbot.addWidget(window)
-    customer_view = window.tab_widget.widget(1)
+    customer_view = window.ensure_tab_view(1)
     refresh_spy = mocker.patch.object(window, "refresh_relevant_views")
 
     mocker.patch("ui.customer_view.EditCustomerDialog", return_value=FakeDialog())
@@ -87,6 +129,7 @@ def test_main_window_refreshes_once_for_customer_add(
 
     customer_view.add_customer()
 
+    qtbot.waitUntil(lambda: refresh_spy.call_count == 1)
     refresh_spy.assert_called_once_with(CUSTOMER_REFRESH_TARGETS)
 
 
@@ -109,7 +152,7 @@ def test_main_window_refreshes_once_for_product_add(
 
     window = MainWindow()
     qtbot.addWidget(window)
-    product_view = window.tab_widget.widget(2)
+    product_view = window.ensure_tab_view(2)
     refresh_spy = mocker.patch.object(window, "refresh_relevant_views")
 
     mocker.patch("ui.product_view.EditProductDialog", return_value=FakeDialog())
@@ -125,6 +168,7 @@ def test_main_window_refreshes_once_for_product_add(
 
     product_view.add_product()
 
+    qtbot.waitUntil(lambda: refresh_spy.call_count == 1)
     refresh_spy.assert_called_once_with(PRODUCT_REFRESH_TARGETS)
 
 
@@ -133,7 +177,7 @@ def test_main_window_refreshes_once_for_purchase_create(
 ):
     window = MainWindow()
     qtbot.addWidget(window)
-    purchase_view = window.tab_widget.widget(4)
+    purchase_view = window.ensure_tab_view(4)
     refresh_spy = mocker.patch.object(window, "refresh_relevant_views")
 
     purchase_view.supplier_input.setText("Proveedor Ventana")
@@ -152,6 +196,7 @@ def test_main_window_refreshes_once_for_purchase_create(
 
     purchase_view.complete_purchase()
 
+    qtbot.waitUntil(lambda: refresh_spy.call_count == 1)
     refresh_spy.assert_called_once_with(PURCHASE_REFRESH_TARGETS)
 
 
@@ -161,13 +206,28 @@ def test_refresh_relevant_views_only_refreshes_requested_tabs(
     window = MainWindow()
     qtbot.addWidget(window)
 
+    for index in range(window.tab_widget.count()):
+        window.ensure_tab_view(index)
+    products_index = window.tab_widget.indexOf(window.views_by_name["Productos"])
+    window.tab_widget.setCurrentIndex(products_index)
+
     refresh_spies = {}
-    for tab_name, widget in window.views_by_name.items():
-        refresh_spies[tab_name] = mocker.patch.object(widget, "refresh")
+    for tab_name in window.views_by_name:
+        refresh_spies[tab_name] = mocker.Mock()
+        window._refreshers[tab_name] = refresh_spies[tab_name]
 
     window.refresh_relevant_views(("Productos", AUDIT_TAB))
+    window.refresh_relevant_views(("Productos",))
+    assert refresh_spies["Productos"].call_count == 0
 
+    qtbot.waitUntil(lambda: refresh_spies["Productos"].call_count == 1)
     assert refresh_spies["Productos"].call_count == 1
+
+    # Hidden tabs are only marked stale until the user switches to them.
+    assert refresh_spies[AUDIT_TAB].call_count == 0
+    window.tab_widget.setCurrentIndex(
+        window.tab_widget.indexOf(window.views_by_name[AUDIT_TAB])
+    )
     assert refresh_spies[AUDIT_TAB].call_count == 1
 
     for tab_name, spy in refresh_spies.items():
@@ -175,6 +235,32 @@ def test_refresh_relevant_views_only_refreshes_requested_tabs(
             assert spy.call_count == 0
 
 
+def test_failed_refresh_requeues_the_targets_it_kept_from_running(
+    qtbot, db_manager, mocker, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+
+    for index in range(window.tab_widget.count()):
+        window.ensure_tab_view(index)
+    products_index = window.tab_widget.indexOf(window.views_by_name["Productos"])
+    window.tab_widget.setCurrentIndex(products_index)
+    for tab_name in window.views_by_name:
+        window._refreshers[tab_name] = mocker.Mock()
+    window._refreshers["Productos"].side_effect = RuntimeError("boom")
+    window._dirty_tabs.clear()
+    window._pending_refresh_targets = {AUDIT_TAB, INVENTORY_TAB, "Productos"}
+
+    with pytest.raises(UIException):
+        window._do_refresh_relevant_views()
+
+    # Productos ran and failed; the tabs after it in tab order are kept.
+    assert window._pending_refresh_targets == {INVENTORY_TAB, AUDIT_TAB}
+    assert window._refresh_timer.isActive()
+    assert not window._dirty_tabs & {INVENTORY_TAB, AUDIT_TAB}
+    window._refresh_timer.stop()
+
+
 def test_purchase_view_delete_does_not_reemit_purchase_deleted_event(
     qtbot, db_manager, mocker, allow_main_window_close
 ):
@@ -188,7 +274,7 @@ def test_purchase_view_delete_does_not_reemit_purchase_deleted_event(
     try:
         window = MainWindow()
         qtbot.addWidget(window)
-        purchase_view = window.tab_widget.widget(4)
+        purchase_view = window.ensure_tab_view(4)
         mocker.patch("ui.purchase_view.show_info_message")
         mocker.patch(
             "ui.purchase_view.QMessageBox.question",
@@ -209,3 +295,111 @@ def test_purchase_view_delete_does_not_reemit_purchase_deleted_event(
         assert payloads == [304]
     finally:
         event_system.purchase_deleted.disconnect(handler)
+
+
+def test_show_status_message_skips_unchanged_text(
+    qtbot, db_manager, mocker, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    show_spy = mocker.spy(window.status_bar, "showMessage")
+
+    window.show_status_message("Producto agregado (ID: 1)")
+    window.show_status_message("Producto agregado (ID: 1)")
+    window.show_status_message("Producto agregado (ID: 2)")
+
+    assert show_spy.call_count == 2
+
+
+def test_function_keys_switch_tabs(qtbot, db_manager, allow_main_window_close):
+    window = MainWindow()
+    qtbot.addWidget(window)
+
+    qtbot.keyClick(window, Qt.Key.Key_F3)
+    assert window.tab_widget.currentIndex() == 2
+
+    qtbot.keyClick(window, Qt.Key.Key_F8)
+    assert window.tab_widget.currentIndex() == 7
+
+
+def test_function_key_reports_failed_tab_view_creation(
+    qtbot, db_manager, mocker, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    start_index = window.tab_widget.currentIndex()
+    window._tab_factories[7] = mocker.Mock(side_effect=RuntimeError("boom"))
+    dialog_mock = mocker.patch("ui.main_window.show_error_dialog")
+
+    qtbot.keyClick(window, Qt.Key.Key_F8)
+
+    assert window.tab_widget.currentIndex() == start_index
+    dialog_mock.assert_called_once()
+    assert "boom" in dialog_mock.call_args.args[1]
+
+
+def test_backup_data_runs_off_the_gui_thread(
+    qtbot, db_manager, mocker, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    info_spy = mocker.patch("ui.main_window.QMessageBox.information")
+    backup_threads = []
+
+    def create_backup():
+        backup_threads.append(threading.get_ident())
+        return "/tmp/backup.db"
+
+    mocker.patch(
+        "services.backup_service.backup_service.create_backup",
+        side_effect=create_backup,
+    )
+
+    window.backup_data()
+
+    qtbot.waitUntil(lambda: info_spy.call_count == 1, timeout=2000)
+    assert backup_threads and backup_threads[0] != threading.get_ident()
+    assert not window._backup_running
+
+
+def test_menu_bar_is_built_after_construction(
+    qtbot, db_manager, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+
+    assert window.menuBar().actions() == []
+    qtbot.waitUntil(lambda: len(window.menuBar().actions()) == 3)
+
+
+def test_refresh_current_tab_uses_registered_refresher(
+    qtbot, db_manager, mocker, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    tab_name = window.tab_widget.tabText(window.tab_widget.currentIndex())
+    refresh_spy = mocker.Mock()
+    window._refreshers[tab_name] = refresh_spy
+    window._dirty_tabs.add(tab_name)
+
+    window.refresh_current_tab()
+
+    refresh_spy.assert_called_once_with()
+    assert tab_name not in window._dirty_tabs
+
+
+def test_last_tab_index_is_recorded_on_close(
+    qtbot, db_manager, mocker, allow_main_window_close
+):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    set_value_spy = mocker.patch.object(window.settings, "setValue")
+    mocker.patch.object(window.settings, "flush")
+
+    window.switch_to_tab(2)
+    window.switch_to_tab(3)
+    assert set_value_spy.call_count == 0
+
+    window.close()
+
+    set_value_spy.assert_any_call("LastTabIndex", 3)
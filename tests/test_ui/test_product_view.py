@@ -1,11 +1,23 @@
+import threading
+
 import pytest
 
 pytest.importorskip("PySide6", reason="PySide6 not installed")
 
-from PySide6.QtWidgets import QMessageBox, QPushButton
-
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QMessageBox,
+    QPushButton,
+    QStyleOptionViewItem,
+    QTableWidget,
+)
+
+import ui.product_view
+from models.product import Product
+from services.category_service import CategoryService
 from services.product_service import ProductService
-from ui.product_view import ProductView
+from ui.product_view import NAME_SUGGESTION_LIMIT, ProductView
+from ui.product_view_tables import ACTION_LABELS_ROLE
 from utils.exceptions import DatabaseException
 from utils.system.event_system import event_system
 
@@ -20,6 +32,23 @@ def capture_signal(signal):
     return payloads, handler
 
 
+def _wait_loaded(qtbot, view):
+    qtbot.waitUntil(lambda: not view.is_loading, timeout=2000)
+
+
+def _fetch_next_page(view):
+    if view.product_model.canFetchMore():
+        view.product_model.fetchMore()
+    return view.product_proxy.rowCount()
+
+
+def _create_view(qtbot):
+    view = ProductView()
+    qtbot.addWidget(view)
+    _wait_loaded(qtbot, view)
+    return view
+
+
 def test_product_action_buttons_reflect_active_status(qtbot, db_manager):
     service = ProductService()
     service.create_product(
@@ -32,17 +61,80 @@ def test_product_action_buttons_reflect_active_status(qtbot, db_manager):
         }
     )
 
-    view = ProductView()
-    qtbot.addWidget(view)
+    view = _create_view(qtbot)
+
+    model = view.product_table.model()
+    assert model.index(0, 4).data() == "Activo"
+    assert model.index(0, 8).data(ACTION_LABELS_ROLE) == ("Editar", "Eliminar")
 
-    assert view.product_table.item(0, 4).text() == "Activo"
+    view.show_archived_checkbox.setChecked(True)
+    product = view._product_at(0)
+    view.product_service.delete_product(product.id)
+    view.load_products()
+    _wait_loaded(qtbot, view)
 
-    actions_widget = view.product_table.cellWidget(0, 8)
-    buttons = actions_widget.findChildren(QPushButton)
+    assert model.index(0, 4).data() == "Archivado"
+    assert model.index(0, 8).data(ACTION_LABELS_ROLE) == ("Editar", "Restaurar")
 
-    assert [button.text() for button in buttons] == ["Editar", "Eliminar"]
-    assert all(button.minimumWidth() == 80 for button in buttons)
-    assert all(button.maximumWidth() == 80 for button in buttons)
+
+def test_product_action_buttons_dispatch_edit_and_delete(qtbot, db_manager, mocker):
+    ProductService().create_product(
+        {"name": "Producto Delegado", "cost_price": 100, "sell_price": 200}
+    )
+    view = _create_view(qtbot)
+    view.resize(1200, 400)
+    view.show()
+    qtbot.waitExposed(view)
+    edit_mock = mocker.patch.object(view, "edit_product")
+    delete_mock = mocker.patch.object(view, "delete_product")
+
+    index = view.product_table.model().index(0, 8)
+    cell_rect = view.product_table.visualRect(index)
+    edit_rect, delete_rect = view._actions_delegate.button_rects(cell_rect, 2)
+    for rect in (edit_rect, delete_rect):
+        qtbot.mouseClick(
+            view.product_table.viewport(),
+            Qt.MouseButton.LeftButton,
+            pos=rect.center(),
+        )
+
+    assert edit_mock.call_args.args[0].name == "Producto Delegado"
+    assert delete_mock.call_args.args[0].name == "Producto Delegado"
+
+
+def test_product_table_fill_makes_no_per_row_service_calls(qtbot, db_manager, mocker):
+    service = ProductService()
+    for index in range(3):
+        service.create_product(
+            {"name": f"Producto {index}", "cost_price": 100, "sell_price": 150}
+        )
+    view = _create_view(qtbot)
+    get_product_spy = mocker.spy(view.product_service, "get_product")
+    margin_spy = mocker.spy(view.product_service, "get_product_profit_margin")
+    get_page_spy = mocker.spy(view.product_service, "get_products_page")
+
+    view.load_products()
+    _wait_loaded(qtbot, view)
+
+    assert get_page_spy.call_count == 1
+    assert get_product_spy.call_count == 0
+    assert margin_spy.call_count == 0
+    assert view.product_table.model().index(0, 7).data() == "33,33%"
+
+
+def test_search_input_filters_after_typing_pause(qtbot, db_manager, mocker):
+    service = ProductService()
+    service.create_product({"name": "Galletas", "cost_price": 100, "sell_price": 150})
+    service.create_product({"name": "Bebida", "cost_price": 100, "sell_price": 150})
+    view = _create_view(qtbot)
+    get_all_spy = mocker.spy(view.product_service, "get_all_products")
+
+    qtbot.keyClicks(view.search_input, "gall")
+    assert view.product_proxy.rowCount() == 2
+
+    qtbot.waitUntil(lambda: view.product_proxy.rowCount() == 1, timeout=1000)
+    assert view.product_proxy.index(0, 1).data() == "Galletas"
+    assert get_all_spy.call_count == 0
 
 
 def test_add_product_does_not_reemit_product_added_event(qtbot, db_manager, mocker):
@@ -60,8 +152,7 @@ def test_add_product_does_not_reemit_product_added_event(qtbot, db_manager, mock
         def exec(self):
             return True
 
-    view = ProductView()
-    qtbot.addWidget(view)
+    view = _create_view(qtbot)
     mocker.patch("ui.product_view.EditProductDialog", return_value=FakeDialog())
     mocker.patch("ui.product_view.show_info_message")
 
@@ -82,6 +173,53 @@ def test_add_product_does_not_reemit_product_added_event(qtbot, db_manager, mock
         event_system.product_added.disconnect(handler)
 
 
+def test_add_product_fetches_only_the_new_row(qtbot, db_manager, mocker):
+    service = ProductService()
+    service.create_product({"name": "Existente", "cost_price": 100, "sell_price": 150})
+    view = _create_view(qtbot)
+    dialog = mocker.Mock()
+    dialog.exec.return_value = True
+    dialog.product_data = {"name": "Nuevo", "cost_price": 200, "sell_price": 300}
+    mocker.patch.object(view, "_product_dialog", return_value=dialog)
+    mocker.patch("ui.product_view.show_info_message")
+    reload_spy = mocker.spy(view, "_load_product_pages")
+    get_product_spy = mocker.spy(view.product_service, "get_product")
+
+    try:
+        view.add_product()
+
+        assert reload_spy.call_count == 0
+        assert get_product_spy.call_count == 1
+        assert view.product_model.rowCount() == 2
+        assert view.product_model.index(1, 1).data() == "Nuevo"
+    finally:
+        view.cleanup()
+
+
+def test_product_dialogs_reuse_the_loaded_categories(qtbot, db_manager, mocker):
+    CategoryService.create_category("Panadería")
+    view = _create_view(qtbot)
+    dialog = mocker.Mock()
+    dialog.exec.return_value = False
+    product_dialog = mocker.patch.object(view, "_product_dialog", return_value=dialog)
+    get_categories_spy = mocker.spy(view.category_service, "get_all_categories")
+
+    view.add_product()
+    view.edit_product(Product(id=1, name="Pan", sell_price=100))
+
+    assert get_categories_spy.call_count == 0
+    for call in product_dialog.call_args_list:
+        assert [category.name for category in call.args[1]] == ["Panadería"]
+
+    CategoryService.create_category("Lácteos")
+    view.add_product()
+    assert [category.name for category in product_dialog.call_args.args[1]] == [
+        "Lácteos",
+        "Panadería",
+    ]
+    view.cleanup()
+
+
 def test_edit_product_does_not_reemit_product_updated_event(qtbot, db_manager, mocker):
     service = ProductService()
     product_id = service.create_product(
@@ -109,8 +247,7 @@ def test_edit_product_does_not_reemit_product_updated_event(qtbot, db_manager, m
         def exec(self):
             return True
 
-    view = ProductView()
-    qtbot.addWidget(view)
+    view = _create_view(qtbot)
     mocker.patch("ui.product_view.EditProductDialog", return_value=FakeDialog())
     mocker.patch("ui.product_view.show_info_message")
 
@@ -145,11 +282,10 @@ def test_delete_product_does_not_reemit_product_deleted_event(
     )
     product = service.get_product(product_id)
 
-    view = ProductView()
-    qtbot.addWidget(view)
+    view = _create_view(qtbot)
     mocker.patch("ui.product_view.show_info_message")
     mocker.patch(
-        "ui.product_view.QMessageBox.question",
+        "ui.product_view.QMessageBox.exec",
         return_value=QMessageBox.StandardButton.Yes,
     )
 
@@ -169,11 +305,34 @@ def test_delete_product_does_not_reemit_product_deleted_event(
         event_system.product_deleted.disconnect(handler)
 
 
-def test_show_context_menu_handles_missing_product_from_service(
+def test_delete_confirmations_reuse_one_message_box(qtbot, db_manager, mocker):
+    service = ProductService()
+    product = service.get_product(
+        service.create_product({"name": "Leche", "cost_price": 1, "sell_price": 2})
+    )
+    view = _create_view(qtbot)
+    exec_mock = mocker.patch(
+        "ui.product_view.QMessageBox.exec",
+        return_value=QMessageBox.StandardButton.No,
+    )
+    delete_mock = mocker.patch.object(view.product_service, "delete_product")
+
+    view.delete_product(product)
+    first_box = view._confirm_box
+    view.delete_product(product)
+
+    assert view._confirm_box is first_box
+    assert "Leche" in first_box.text()
+    assert first_box.defaultButton() is first_box.button(QMessageBox.StandardButton.No)
+    assert exec_mock.call_count == 2
+    delete_mock.assert_not_called()
+
+
+def test_row_actions_use_the_loaded_product_without_refetching(
     qtbot, db_manager, mocker
 ):
     service = ProductService()
-    service.create_product(
+    product_id = service.create_product(
         {
             "name": "Producto Contextual",
             "description": "Fila para menú",
@@ -183,15 +342,24 @@ def test_show_context_menu_handles_missing_product_from_service(
         }
     )
 
-    view = ProductView()
-    qtbot.addWidget(view)
-    mocker.patch.object(view.product_service, "get_product", return_value=None)
-    show_error = mocker.patch("ui.product_view.show_error_message")
+    view = _create_view(qtbot)
+    get_product_spy = mocker.spy(view.product_service, "get_product")
+    delete_product = mocker.patch.object(view, "delete_product")
+    menu = mocker.patch("ui.product_view.QMenu").return_value
+    menu.addAction.side_effect = lambda text: text
+    menu.exec.return_value = "Eliminar"
 
-    position = view.product_table.visualItemRect(view.product_table.item(0, 0)).center()
+    model = view.product_table.model()
+    position = view.product_table.visualRect(model.index(0, 0)).center()
     view.show_context_menu(position)
+    view.product_table.selectRow(0)
+    qtbot.keyClick(view, Qt.Key.Key_Delete)
 
-    show_error.assert_called_once_with("Error", "Error al mostrar el menú contextual")
+    assert [call.args[0].id for call in delete_product.call_args_list] == [
+        product_id,
+        product_id,
+    ]
+    assert get_product_spy.call_count == 0
 
 
 def test_add_product_shows_single_error_dialog_for_service_failure(
@@ -211,8 +379,7 @@ def test_add_product_shows_single_error_dialog_for_service_failure(
         def exec(self):
             return True
 
-    view = ProductView()
-    qtbot.addWidget(view)
+    view = _create_view(qtbot)
     mocker.patch("ui.product_view.EditProductDialog", return_value=FakeDialog())
     show_error_dialog = mocker.patch("utils.decorators.show_error_dialog")
     mocker.patch.object(
@@ -229,3 +396,313 @@ def test_add_product_shows_single_error_dialog_for_service_failure(
     assert args[0] == "Operation Failed"
     assert "fallo controlado de producto" in args[1]
     assert args[2] is view
+
+
+def test_product_reload_keeps_fixed_column_widths(qtbot, db_manager, mocker):
+    ProductService().create_product(
+        {
+            "name": "Producto con un nombre bastante largo para la columna",
+            "cost_price": 100,
+            "sell_price": 150,
+        }
+    )
+    view = _create_view(qtbot)
+    resize_spy = mocker.spy(view.product_table, "resizeColumnsToContents")
+
+    view.load_products()
+    _wait_loaded(qtbot, view)
+
+    assert resize_spy.call_count == 0
+    assert view.product_table.columnWidth(1) == 220
+
+
+def test_product_events_patch_single_rows(qtbot, db_manager, mocker):
+    service = ProductService()
+    product_id = service.create_product(
+        {"name": "Azúcar", "cost_price": 100, "sell_price": 150}
+    )
+    view = _create_view(qtbot)
+    reload_spy = mocker.spy(view, "_load_product_pages")
+
+    try:
+        view.product_service.update_product(product_id, {"name": "Azúcar Flor"})
+        assert view.product_model.index(0, 1).data() == "Azúcar Flor"
+
+        get_product_spy = mocker.spy(view.product_service, "get_product")
+        view.product_service.delete_product(product_id)
+        assert view.product_model.rowCount() == 0
+        # Archiving drops the row without fetching the product again.
+        assert get_product_spy.call_count == 0
+    finally:
+        view.cleanup()
+
+    assert reload_spy.call_count == 0
+
+
+def test_category_filter_queries_only_matching_products(qtbot, db_manager, mocker):
+    category_id = CategoryService.create_category("Bebidas")
+    service = ProductService()
+    service.create_product(
+        {
+            "name": "Jugo",
+            "category_id": category_id,
+            "cost_price": 100,
+            "sell_price": 150,
+        }
+    )
+    service.create_product({"name": "Arroz", "cost_price": 100, "sell_price": 150})
+    view = _create_view(qtbot)
+    get_page_spy = mocker.spy(view.product_service, "get_products_page")
+
+    view.category_filter.setCurrentIndex(view.category_filter.findData(category_id))
+    _wait_loaded(qtbot, view)
+
+    assert get_page_spy.call_args.kwargs["category_id"] == category_id
+    assert view.product_model.rowCount() == 1
+    assert view.product_proxy.index(0, 1).data() == "Jugo"
+
+
+def test_product_dialog_is_reused_and_repopulated(qtbot, db_manager):
+    CategoryService.create_category("Aseo")
+    categories = CategoryService.get_all_categories()
+    view = _create_view(qtbot)
+    product = Product(id=5, name="Jabón", category_id=categories[0].id, sell_price=990)
+
+    dialog = view._product_dialog(product, categories)
+    dialog.category_combo.addItem("Marcador", -1)
+    reused = view._product_dialog(None, categories)
+
+    assert reused is dialog
+    assert reused.windowTitle() == "Agregar Producto"
+    assert reused.name_input.text() == ""
+    assert reused.sell_price_input.value() == 0
+    assert reused.category_combo.currentData() is None
+    # Same categories: the combo was not rebuilt.
+    assert reused.category_combo.findData(-1) >= 0
+
+    CategoryService.create_category("Bazar")
+    categories = CategoryService.get_all_categories()
+    view._product_dialog(product, categories)
+    assert dialog.category_combo.findData(-1) == -1
+    assert dialog.category_combo.count() == len(categories) + 1
+    assert dialog.category_combo.currentData() == categories[0].id
+
+
+def test_product_dialog_selects_category_without_scanning_the_combo(
+    qtbot, db_manager, mocker
+):
+    CategoryService.create_category("Aseo")
+    CategoryService.create_category("Bazar")
+    categories = CategoryService.get_all_categories()
+    view = _create_view(qtbot)
+    dialog = view._product_dialog(None, categories)
+    find_spy = mocker.spy(dialog.category_combo, "findData")
+
+    product = Product(id=5, name="Jabón", category_id=categories[1].id)
+    view._product_dialog(product, categories)
+
+    assert dialog.category_combo.currentData() == categories[1].id
+    assert find_spy.call_count == 0
+
+
+def test_product_table_sorts_ids_and_margins_numerically(qtbot, db_manager):
+    service = ProductService()
+    for index, sell_price in enumerate((110, 1000, 200)):
+        service.create_product(
+            {"name": f"Orden {index}", "cost_price": 100, "sell_price": sell_price}
+        )
+    view = _create_view(qtbot)
+
+    view.product_table.sortByColumn(7, Qt.SortOrder.DescendingOrder)
+
+    margins = [view.product_proxy.index(row, 7).data() for row in range(3)]
+    assert margins == ["90,00%", "50,00%", "9,09%"]
+
+
+def test_product_rows_do_not_own_widgets_or_slots(qtbot, db_manager):
+    service = ProductService()
+    for index in range(3):
+        service.create_product(
+            {"name": f"Fila {index}", "cost_price": 100, "sell_price": 150}
+        )
+    view = _create_view(qtbot)
+    buttons_before = len(view.findChildren(QPushButton))
+
+    view.load_products()
+    _wait_loaded(qtbot, view)
+
+    proxy = view.product_proxy
+    assert proxy.rowCount() == 3
+    assert all(
+        view.product_table.indexWidget(proxy.index(row, 8)) is None
+        for row in range(proxy.rowCount())
+    )
+    assert len(view.findChildren(QPushButton)) == buttons_before
+
+
+def test_load_products_queries_off_the_ui_thread(qtbot, db_manager, mocker):
+    view = _create_view(qtbot)
+    threads = []
+    count_products = view.product_service.count_products
+
+    def record(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return count_products(*args, **kwargs)
+
+    mocker.patch.object(view.product_service, "count_products", side_effect=record)
+
+    view.load_products()
+    assert view.is_loading
+    _wait_loaded(qtbot, view)
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_product_query_workers_do_not_reference_the_view(qtbot, db_manager, mocker):
+    worker_spy = mocker.spy(ui.product_view, "QueryWorker")
+    view = _create_view(qtbot)
+    view.filter_products("pan")
+    _wait_loaded(qtbot, view)
+
+    assert worker_spy.call_count == 2
+    for call in worker_spy.call_args_list:
+        for arg in (*call.args, *call.kwargs.values()):
+            assert arg is not view
+            assert getattr(arg, "__self__", None) is not view
+
+
+def test_bulk_update_reloads_once_instead_of_per_event(qtbot, db_manager, mocker):
+    view = _create_view(qtbot)
+    patch_spy = mocker.spy(view.product_model, "upsert_product")
+    reload_spy = mocker.spy(view, "_load_product_pages")
+
+    try:
+        with view._bulk_update():
+            for index in range(3):
+                view.product_service.create_product(
+                    {"name": f"Lote {index}", "cost_price": 100, "sell_price": 150}
+                )
+        _wait_loaded(qtbot, view)
+
+        assert patch_spy.call_count == 0
+        assert reload_spy.call_count == 1
+        assert view.product_proxy.rowCount() == 3
+
+        view.product_service.create_product(
+            {"name": "Suelto", "cost_price": 100, "sell_price": 150}
+        )
+        assert patch_spy.call_count == 1
+    finally:
+        view.cleanup()
+
+
+def test_product_table_is_a_lazy_model_view(qtbot, db_manager, mocker):
+    mocker.patch("ui.product_view.PRODUCT_PAGE_SIZE", 2)
+    mocker.patch("ui.product_view_tables.PRODUCT_PAGE_SIZE", 2)
+    service = ProductService()
+    ids = [
+        service.create_product(
+            {"name": f"Perezoso {index}", "cost_price": 100, "sell_price": 150}
+        )
+        for index in range(5)
+    ]
+    get_page_spy = mocker.spy(service.__class__, "get_products_page")
+
+    view = _create_view(qtbot)
+
+    assert not isinstance(view.product_table, QTableWidget)
+    assert view.product_table.model() is view.product_proxy
+    qtbot.waitUntil(lambda: _fetch_next_page(view) == 5, timeout=2000)
+    after_ids = sorted(call.args[1] for call in get_page_spy.call_args_list)
+    assert after_ids == [0, ids[1], ids[3]]
+
+
+def test_reload_requests_are_coalesced(qtbot, db_manager, mocker):
+    view = _create_view(qtbot)
+    reload_spy = mocker.spy(view, "_load_product_pages")
+
+    for _ in range(3):
+        view.load_products()
+    view.show_archived_checkbox.setChecked(True)
+    _wait_loaded(qtbot, view)
+
+    assert reload_spy.call_count == 1
+
+
+def test_action_buttons_delegate_sizes_the_column_for_its_buttons(qtbot, db_manager):
+    ProductService().create_product(
+        {"name": "Ancho", "cost_price": 100, "sell_price": 150}
+    )
+    view = _create_view(qtbot)
+    delegate = view._actions_delegate
+    option = QStyleOptionViewItem()
+
+    hint = delegate.sizeHint(option, view.product_proxy.index(0, 8))
+
+    assert hint.width() == 2 * delegate.BUTTON_WIDTH + delegate.BUTTON_SPACING + 8
+
+
+def test_category_events_refresh_filter_and_keep_selection(qtbot, db_manager, mocker):
+    frutas_id = CategoryService.create_category("Frutas")
+    verduras_id = CategoryService.create_category("Verduras")
+    view = _create_view(qtbot)
+    view.category_filter.setCurrentIndex(view.category_filter.findData(frutas_id))
+    _wait_loaded(qtbot, view)
+    set_model_spy = mocker.spy(view.category_filter, "setModel")
+
+    try:
+        CategoryService.create_category("Lácteos")
+        assert view.category_filter.findText("Lácteos") >= 0
+        assert view.category_filter.currentData() == frutas_id
+
+        view.on_categories_changed()
+        assert set_model_spy.call_count == 1
+
+        CategoryService.delete_category(frutas_id)
+        assert view.category_filter.currentData() is None
+        assert view.current_category_id is None
+        assert view.category_filter.findData(verduras_id) >= 0
+        _wait_loaded(qtbot, view)
+    finally:
+        view.cleanup()
+
+
+def test_search_input_suggests_names_from_its_own_query(qtbot, db_manager, mocker):
+    service = ProductService()
+    service.create_product(
+        {"name": "Leche Entera", "cost_price": 500, "sell_price": 800}
+    )
+    service.create_product({"name": "Pan", "cost_price": 50, "sell_price": 100})
+    view = _create_view(qtbot)
+    names_spy = mocker.spy(view.product_service, "get_product_names")
+
+    completer = view.search_input.completer()
+    assert completer.model() is not view.product_model
+    view.search_input.setText("ENTERA")
+    qtbot.waitUntil(lambda: completer.model().rowCount() == 1, timeout=2000)
+
+    assert names_spy.call_args.args[:2] == ("ENTERA", NAME_SUGGESTION_LIMIT)
+    completer.setCompletionPrefix("ENTERA")
+    assert completer.currentCompletion() == "Leche Entera"
+
+    view.search_input.clear()
+    qtbot.waitUntil(lambda: completer.model().rowCount() == 0, timeout=2000)
+
+
+def test_sorting_loads_the_whole_catalog_first(qtbot, db_manager, mocker):
+    mocker.patch("ui.product_view.PRODUCT_PAGE_SIZE", 2)
+    mocker.patch("ui.product_view_tables.PRODUCT_PAGE_SIZE", 2)
+    service = ProductService()
+    for name in ("Bebida", "Arroz", "Cereal", "Dulce", "Zapallo"):
+        service.create_product({"name": name, "cost_price": 100, "sell_price": 150})
+    view = _create_view(qtbot)
+    _wait_loaded(qtbot, view)
+
+    assert view.product_proxy.sortColumn() == 0
+    assert view.product_proxy.sortOrder() == Qt.SortOrder.AscendingOrder
+
+    view.product_table.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+    qtbot.waitUntil(lambda: view.product_proxy.rowCount() == 5, timeout=2000)
+
+    names = [view.product_proxy.index(row, 1).data() for row in range(5)]
+    assert names == ["Zapallo", "Dulce", "Cereal", "Bebida", "Arroz"]
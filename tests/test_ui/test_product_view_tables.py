@@ -0,0 +1,181 @@
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 not installed")
+
+from PySide6.QtCore import QSortFilterProxyModel, Qt
+
+from models.product import Product
+from ui.product_view_tables import (
+    PRODUCT_PAGE_SIZE,
+    ProductFilterProxyModel,
+    ProductTableModel,
+)
+
+
+def _products():
+    return [
+        Product(
+            id=1,
+            name="Arroz",
+            description="Grano largo",
+            category_name="Abarrotes",
+            cost_price=1000,
+            sell_price=1500,
+        ),
+        Product(id=2, name="Pan", cost_price=900, sell_price=10000, is_active=False),
+    ]
+
+
+def test_product_model_formats_rows():
+    model = ProductTableModel()
+    model.set_products(_products())
+
+    assert model.rowCount() == 2
+    assert model.index(0, 3).data() == "Abarrotes"
+    assert model.index(1, 3).data() == "Sin Categoría"
+    assert model.index(1, 4).data() == "Archivado"
+    assert model.index(1, 6).data() == "10.000"
+    assert model.index(0, 7).data() == "33,33%"
+    assert model.index(0, 7).data(Qt.ItemDataRole.EditRole) == 33.33
+    assert model.headerData(7, Qt.Orientation.Horizontal) == "Margen Ganancia"
+
+
+def test_product_model_sorts_prices_numerically_through_proxy():
+    model = ProductTableModel()
+    model.set_products(_products())
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setSortRole(Qt.ItemDataRole.EditRole)
+
+    proxy.sort(6, Qt.SortOrder.DescendingOrder)
+    source_row = proxy.mapToSource(proxy.index(0, 0)).row()
+
+    assert model.product_at(source_row).name == "Pan"
+    assert model.product_at(5) is None
+
+
+def test_product_filter_proxy_matches_search_and_category():
+    model = ProductTableModel()
+    products = _products()
+    products[0].category_id = 7
+    model.set_products(products)
+    proxy = ProductFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    proxy.set_filters("GRANO", None)
+    assert proxy.rowCount() == 1
+    assert proxy.index(0, 1).data() == "Arroz"
+
+    proxy.set_filters("", 7)
+    assert proxy.rowCount() == 1
+
+    proxy.set_filters("pan", 7)
+    assert proxy.rowCount() == 0
+
+
+def test_product_model_upserts_and_removes_single_rows():
+    model = ProductTableModel()
+    model.set_products(_products())
+
+    model.upsert_product(Product(id=2, name="Pan Amasado", sell_price=1200))
+    model.upsert_product(Product(id=3, name="Leche", sell_price=990))
+
+    assert model.rowCount() == 3
+    assert model.index(1, 1).data() == "Pan Amasado"
+    assert model.index(1, 4).data() == "Activo"
+    assert model.index(2, 1).data() == "Leche"
+
+    assert model.remove_product(1) is True
+    assert model.remove_product(99) is False
+    assert [model.index(row, 0).data() for row in range(2)] == ["2", "3"]
+    model.upsert_product(Product(id=3, name="Leche Entera", sell_price=990))
+    assert model.index(1, 1).data() == "Leche Entera"
+
+
+def test_product_model_fetches_pages_on_demand():
+    catalog = [Product(id=i, name=f"Producto {i}") for i in range(1, 451)]
+    calls = []
+
+    def fetch_page(after_id, limit):
+        calls.append((after_id, limit))
+        return [product for product in catalog if product.id > after_id][:limit]
+
+    model = ProductTableModel()
+    model.set_page_source(fetch_page, len(catalog))
+
+    assert model.rowCount() == PRODUCT_PAGE_SIZE
+    assert model.canFetchMore()
+    model.upsert_product(Product(id=450, name="Producto 450"))
+    while model.canFetchMore():
+        model.fetchMore()
+
+    assert model.rowCount() == 450
+    assert calls == [(0, 200), (200, 200), (400, 200)]
+
+
+def test_product_filter_proxy_skips_row_lookups_without_filters(mocker):
+    model = ProductTableModel()
+    model.set_products(_products())
+    proxy = ProductFilterProxyModel()
+    proxy.setSourceModel(model)
+    key_spy = mocker.spy(model, "filter_key_at")
+
+    proxy.set_filters("arroz", None)
+    assert proxy.rowCount() == 1
+    lookups = key_spy.call_count
+
+    proxy.set_filters("", None)
+    assert proxy.rowCount() == 2
+    assert key_spy.call_count == lookups
+
+
+def test_product_filter_proxy_uses_filter_keys_kept_in_step_with_edits():
+    model = ProductTableModel()
+    model.set_products(_products())
+    proxy = ProductFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    assert model.filter_key_at(0) == (None, "arroz\ngrano largo")
+    proxy.set_filters("integral", None)
+    assert proxy.rowCount() == 0
+
+    model.upsert_product(Product(id=1, name="Arroz", description="Integral"))
+    assert proxy.rowCount() == 1
+    proxy.set_filters("largo", None)
+    assert proxy.rowCount() == 0
+
+
+def test_product_model_requests_pages_asynchronously():
+    model = ProductTableModel()
+    requests = []
+    model.page_requested.connect(lambda after_id, limit: requests.append(after_id))
+    first_page = [Product(id=i, name=f"Producto {i}") for i in range(1, 201)]
+
+    model.set_page_source(None, 250, first_page)
+    model.fetchMore()
+
+    assert requests == [200]
+    assert not model.canFetchMore()
+    model.add_page([Product(id=i, name=f"Producto {i}") for i in range(201, 251)])
+    assert model.rowCount() == 250
+    assert not model.canFetchMore()
+
+
+def test_product_model_fetch_all_loads_remaining_pages():
+    model = ProductTableModel()
+    requests = []
+    model.page_requested.connect(lambda after_id, limit: requests.append(after_id))
+    first_page = [Product(id=i, name=f"Producto {i}") for i in range(1, 201)]
+    model.set_page_source(None, 450, first_page)
+
+    model.set_fetch_all(True)
+    assert requests == [200]
+    model.add_page([Product(id=i, name=f"Producto {i}") for i in range(201, 401)])
+    assert requests == [200, 400]
+    model.add_page([Product(id=i, name=f"Producto {i}") for i in range(401, 451)])
+
+    assert model.rowCount() == 450
+    assert requests == [200, 400]
+
+    model.set_page_source(None, 250, first_page)
+    assert requests == [200, 400, 200]
@@ -0,0 +1,12 @@
+from decimal import Decimal
+
+from utils.helpers import format_price
+
+
+def test_format_price_memoizes_repeated_amounts():
+    format_price.cache_clear()
+
+    assert format_price(1500) == "1.500"
+    assert format_price(1500) == "1.500"
+    assert format_price(Decimal("1234567")) == "1.234.567"
+    assert format_price.cache_info().hits == 1
@@ -11,11 +11,10 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from services.category_service import CategoryService
+from services.category_service import category_service
 from utils.decorators import handle_exceptions, ui_operation
 from utils.exceptions import DatabaseException, UIException, ValidationException
 from utils.helpers import show_info_message
-from utils.system.event_system import event_system
 from utils.system.logger import logger
 from utils.validation.validators import validate_string
 
@@ -24,7 +23,7 @@ class AddEditCategoryDialog(QDialog):
     def __init__(self, parent=None, category=None):
         super().__init__(parent)
         self.category = category
-        self.category_service = CategoryService()
+        self.category_service = category_service
         self.setWindowTitle(
             "Agregar Categoría" if category is None else "Editar Categoría"
         )
@@ -63,7 +62,7 @@ class AddEditCategoryDialog(QDialog):
 class CategoryManagementDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.category_service = CategoryService()
+        self.category_service = category_service
         self.setup_ui()
         self.setWindowTitle("Gestión de Categorías")
 
@@ -128,7 +127,6 @@ class CategoryManagementDialog(QDialog):
         if dialog.exec():
             self.load_categories()
             show_info_message("Éxito", "Categoría agregada exitosamente.")
-            event_system.category_added.emit()
             logger.info("New category added")
 
     @ui_operation(show_dialog=True)
@@ -144,7 +142,6 @@ class CategoryManagementDialog(QDialog):
                 if dialog.exec():
                     self.load_categories()
                     show_info_message("Éxito", "Categoría actualizada exitosamente.")
-                    event_system.category_updated.emit(category.id)
                     logger.info(f"Category updated: ID {category.id}")
             else:
                 raise ValidationException(
@@ -175,7 +172,6 @@ class CategoryManagementDialog(QDialog):
                     self.category_service.delete_category(category.id)
                     self.load_categories()
                     show_info_message("Éxito", "Categoría eliminada exitosamente.")
-                    event_system.category_deleted.emit(category.id)
                     logger.info(f"Category deleted: ID {category.id}")
                 else:
                     raise ValidationException(
@@ -24,7 +24,7 @@ from PySide6.QtWidgets import (
 
 from services.analytics_service import AnalyticsService
 from services.customer_service import CustomerService
-from services.inventory_service import InventoryService
+from services.inventory_service import inventory_service
 from services.purchase_service import PurchaseService
 from services.sale_service import SaleService
 from utils.decorators import ui_operation
@@ -79,7 +79,7 @@ class DashboardView(QWidget):
         super().__init__()
         self.sale_service = SaleService()
         self.purchase_service = PurchaseService()
-        self.inventory_service = InventoryService()
+        self.inventory_service = inventory_service
         self.customer_service = CustomerService()
         self.analytics_service = AnalyticsService()
 
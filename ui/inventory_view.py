@@ -1,6 +1,12 @@
-from typing import Any, Dict, List
-
-from PySide6.QtCore import Qt, QTimer
+from typing import Any, Dict, List, Optional, cast
+
+from PySide6.QtCore import (
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+)
 from PySide6.QtGui import QAction, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -16,37 +22,50 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMenu,
     QPushButton,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
-from services.category_service import CategoryService
-from services.inventory_service import InventoryService
-from services.product_service import ProductService
+from models.enums import BarcodeFilter
+from services.category_service import category_service
+from services.inventory_service import inventory_service
+from ui.inventory_view_tables import (
+    ACTION_LABELS_ROLE,
+    ACTIONS_COLUMN,
+    INVENTORY_COLUMN_WIDTHS,
+    INVENTORY_STRETCH_COLUMN,
+    InventoryTableModel,
+)
+from ui.styles import DesignTokens
 from utils.decorators import handle_exceptions, ui_operation
 from utils.exceptions import DatabaseException, UIException, ValidationException
-from utils.helpers import create_table, show_error_message, show_info_message
-from utils.ui.table_items import NumericTableWidgetItem
+from utils.helpers import (
+    create_combo_model,
+    create_table_view,
+    show_error_message,
+    show_info_message,
+)
+from utils.system.event_system import event_system
+from utils.ui.delegates import ActionButtonsDelegate
+from utils.ui.workers import QueryWorker
 
 
 class EditInventoryDialog(QDialog):
     def __init__(self, item: Dict[str, Any], parent=None):
         super().__init__(parent)
-        self.item = item
-        self.setWindowTitle(f"Editar {item['product_name']}")
         self.setup_ui()
+        self.load(item)
 
     def setup_ui(self):
-        layout = QFormLayout(self)
+        self.form_layout = QFormLayout(self)
+        layout = self.form_layout
 
-        # Show barcode if exists
-        if self.item.get("barcode"):
-            barcode_label = QLabel(self.item["barcode"])
-            layout.addRow("Código:", barcode_label)
+        # Barcode row is only visible for products that have one
+        self.barcode_label = QLabel()
+        layout.addRow("Código:", self.barcode_label)
 
         # Quantity input (Read-only current quantity)
-        self.current_quantity_label = QLabel(str(self.item["quantity"]))
+        self.current_quantity_label = QLabel()
         layout.addRow("Cantidad Actual:", self.current_quantity_label)
 
         # Adjustment input
@@ -55,10 +74,12 @@ class EditInventoryDialog(QDialog):
         self.adjustment_input.setMaximum(1000000)
         self.adjustment_input.setDecimals(3)
         self.adjustment_input.setValue(0)
+        # Update the preview when a value is committed, not on every keystroke.
+        self.adjustment_input.setKeyboardTracking(False)
         layout.addRow("Ajustar Cantidad (+/-):", self.adjustment_input)
 
         # New Quantity Preview
-        self.new_quantity_label = QLabel(str(self.item["quantity"]))
+        self.new_quantity_label = QLabel()
         layout.addRow("Nueva Cantidad:", self.new_quantity_label)
         self.adjustment_input.valueChanged.connect(self.update_new_quantity)
 
@@ -75,10 +96,26 @@ class EditInventoryDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addRow(self.button_box)
 
+    def load(self, item: Dict[str, Any]):
+        """Reset the dialog to edit `item`, so one instance can be reused."""
+        self.item = item
+        self._base_qty = float(item["quantity"])
+        self.setWindowTitle(f"Editar {item['product_name']}")
+        barcode = item.get("barcode")
+        self.barcode_label.setText(barcode or "")
+        self.form_layout.setRowVisible(self.barcode_label, bool(barcode))
+        self.current_quantity_label.setText(str(item["quantity"]))
+        self.adjustment_input.blockSignals(True)
+        self.adjustment_input.setValue(0)
+        self.adjustment_input.blockSignals(False)
+        self.new_quantity_label.setText(str(item["quantity"]))
+        self.reason_input.clear()
+        self.adjustment_input.setFocus()
+
     def update_new_quantity(self):
-        current = self.item["quantity"]
-        adjustment = self.adjustment_input.value()
-        self.new_quantity_label.setText(f"{current + adjustment:.3f}")
+        self.new_quantity_label.setText(
+            f"{self._base_qty + self.adjustment_input.value():.3f}"
+        )
 
     def get_data(self):
         return {
@@ -90,12 +127,67 @@ class EditInventoryDialog(QDialog):
 class InventoryView(QWidget):
     def __init__(self):
         super().__init__()
-        self.inventory_service = InventoryService()
-        self.product_service = ProductService()
-        self.category_service = CategoryService()
+        self.inventory_service = inventory_service
+        self.category_service = category_service
         self.current_inventory = []
+        self._barcode_index: Dict[str, Dict[str, Any]] = {}
+        self._by_product_id: Dict[int, Dict[str, Any]] = {}
+        self._category_signature: Optional[tuple] = None
+        self._edit_dialog: Optional[EditInventoryDialog] = None
+        # Collapse bursts of filter/search changes into a single reload.
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(200)
+        self._reload_timer.timeout.connect(self._do_load_inventory)
+        # Only show the wait cursor for loads that are actually slow.
+        self._busy_cursor_timer = QTimer(self)
+        self._busy_cursor_timer.setSingleShot(True)
+        self._busy_cursor_timer.setInterval(150)
+        self._busy_cursor_timer.timeout.connect(self._show_busy_cursor)
+        self._busy_cursor_shown = False
+        self._load_seq = 0
+        self._loaded_seq = 0
+        self._connections = []
         self.setup_ui()
         self.setup_shortcuts()
+        self.connect_signals()
+
+    def connect_signals(self):
+        """Connect signals and track them for cleanup."""
+        self._connections.append(
+            (event_system.inventory_changed, self.on_inventory_changed)
+        )
+        self._connections.append(
+            (event_system.category_added, self.on_categories_changed)
+        )
+        self._connections.append(
+            (event_system.category_updated, self.on_categories_changed)
+        )
+        self._connections.append(
+            (event_system.category_deleted, self.on_categories_changed)
+        )
+
+        for signal, slot in self._connections:
+            signal.connect(slot)
+
+    def disconnect_signals(self):
+        """Safely disconnect all signals."""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except Exception:
+                pass
+        self._connections.clear()
+
+    def cleanup(self):
+        """Cleanup method to properly disconnect signals."""
+        self.disconnect_signals()
+        self._cancel_pending_loads()
+
+    def closeEvent(self, event):
+        """Clean up on close."""
+        self.cleanup()
+        super().closeEvent(event)
 
     @handle_exceptions(UIException, show_dialog=True)
     def setup_ui(self):
@@ -112,6 +204,7 @@ class InventoryView(QWidget):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Buscar productos...")
+        self.search_input.textChanged.connect(self.load_inventory)
         search_button = QPushButton("Buscar")
         search_button.clicked.connect(self.search_products)
 
@@ -134,7 +227,9 @@ class InventoryView(QWidget):
         )  # Reload when filter changes
 
         self.barcode_filter = QComboBox()
-        self.barcode_filter.addItems(["Todos", "Con Código", "Sin Código"])
+        self.barcode_filter.addItem("Todos", BarcodeFilter.ALL)
+        self.barcode_filter.addItem("Con Código", BarcodeFilter.WITH_BARCODE)
+        self.barcode_filter.addItem("Sin Código", BarcodeFilter.WITHOUT_BARCODE)
         self.barcode_filter.currentIndexChanged.connect(self.load_inventory)
 
         filter_layout.addWidget(QLabel("Categoría:"))
@@ -144,26 +239,44 @@ class InventoryView(QWidget):
         layout.addLayout(filter_layout)
 
         # Inventory Table
-        self.inventory_table = create_table(
-            ["ID", "Producto", "Categoría", "Código", "Cantidad", "Acciones"]
-        )
+        # Rows are served lazily by the model; the proxy handles header sorting.
+        self.inventory_model = InventoryTableModel(self)
+        self.inventory_proxy = QSortFilterProxyModel(self)
+        self.inventory_proxy.setSourceModel(self.inventory_model)
+        self.inventory_proxy.setSortRole(Qt.ItemDataRole.EditRole)
+        self.inventory_table = create_table_view(self.inventory_proxy)
         self.inventory_table.setSelectionBehavior(
             QAbstractItemView.SelectionBehavior.SelectRows
         )
         self.inventory_table.setEditTriggers(
             QAbstractItemView.EditTrigger.NoEditTriggers
         )
-        self.inventory_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Stretch
+        # Fixed widths plus a single stretching column avoid recomputing every
+        # section whenever the rows change.
+        header = self.inventory_table.horizontalHeader()
+        header.setStretchLastSection(False)
+        for column, width in INVENTORY_COLUMN_WIDTHS.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            self.inventory_table.setColumnWidth(column, width)
+        header.setSectionResizeMode(
+            INVENTORY_STRETCH_COLUMN, QHeaderView.ResizeMode.Stretch
         )
         self.inventory_table.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu
         )
         self.inventory_table.customContextMenuRequested.connect(self.show_context_menu)
+        self.inventory_table.verticalHeader().setDefaultSectionSize(36)
+        # The "Editar" button is painted by a delegate instead of a widget per row.
+        self._actions_delegate = ActionButtonsDelegate(ACTION_LABELS_ROLE, self)
+        self._actions_delegate.clicked.connect(self.on_edit_button_clicked)
+        self.inventory_table.setItemDelegateForColumn(
+            ACTIONS_COLUMN, self._actions_delegate
+        )
+        self.inventory_table.doubleClicked.connect(self.on_table_double_clicked)
         layout.addWidget(self.inventory_table)
 
         # Load initial data
-        self.load_inventory()
+        self._do_load_inventory()
 
     def setup_shortcuts(self):
         # Refresh (F5)
@@ -179,99 +292,137 @@ class InventoryView(QWidget):
     @ui_operation(show_dialog=True)
     @handle_exceptions(DatabaseException, UIException, show_dialog=True)
     def load_categories(self):
-        self.category_filter.blockSignals(True)
-        self.category_filter.clear()
-        self.category_filter.addItem("Todas las Categorías", None)
+        # get_all_categories is cached by the service; only rebuild the combo
+        # when the category list actually changed.
         categories = self.category_service.get_all_categories()
-        for category in categories:
-            self.category_filter.addItem(category.name, category.id)
+        signature = tuple((category.id, category.name) for category in categories)
+        if signature == self._category_signature:
+            return
+
+        selected_category_id = self.category_filter.currentData()
+        self.category_filter.blockSignals(True)
+        # Hand the combo a complete model instead of inserting item by item.
+        self.category_filter.setModel(
+            create_combo_model(
+                [
+                    ("Todas las Categorías", None),
+                    *((category.name, category.id) for category in categories),
+                ],
+                self.category_filter,
+            )
+        )
+        self.category_filter.setCurrentIndex(
+            max(self.category_filter.findData(selected_category_id), 0)
+        )
         self.category_filter.blockSignals(False)
+        self._category_signature = signature
+
+    def on_categories_changed(self, _payload: object = None):
+        self.load_categories()
+        # Category names are shown in the table and the selected one may be gone.
+        self.load_inventory()
 
-    @ui_operation(show_dialog=True)
-    @handle_exceptions(DatabaseException, UIException, show_dialog=True)
     def load_inventory(self):
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        try:
-            category_id = self.category_filter.currentData()
-            # If category is selected, we filter by it. Otherwise all.
-            # Inventory service might need get_inventory_by_category or we filter locally.
-            # Assuming get_inventory_status returns all and we filter.
-
-            items = self.inventory_service.get_all_inventory()
-
-            # Apply filters
-            filtered_items = []
-            barcode_filter_mode = self.barcode_filter.currentText()
-
-            search_query = self.search_input.text().strip().lower()
-
-            for item in items:
-                # Category Filter
-                if category_id is not None and item.get("category_id") != category_id:
-                    continue
-
-                # Barcode Filter
-                has_barcode = bool(item.get("barcode"))
-                if barcode_filter_mode == "Con Código" and not has_barcode:
-                    continue
-                if barcode_filter_mode == "Sin Código" and has_barcode:
-                    continue
-
-                # Search Filter
-                if search_query:
-                    if (
-                        search_query not in item["product_name"].lower()
-                        and search_query not in str(item.get("barcode", "")).lower()
-                    ):
-                        continue
-
-                filtered_items.append(item)
-
-            self.current_inventory = filtered_items
-            self.update_table(filtered_items)
-
-        finally:
-            QApplication.restoreOverrideCursor()
+        """Schedule a debounced reload of the inventory table."""
+        self._reload_timer.start()
 
-    def update_table(self, items: List[Dict[str, Any]]):
-        self.inventory_table.setRowCount(len(items))
-        for row, item in enumerate(items):
-            self.inventory_table.setItem(
-                row, 0, NumericTableWidgetItem(item["product_id"])
-            )
-            self.inventory_table.setItem(row, 1, QTableWidgetItem(item["product_name"]))
-            self.inventory_table.setItem(
-                row, 2, QTableWidgetItem(item.get("category_name", "Sin Categoría"))
-            )
-            self.inventory_table.setItem(
-                row, 3, QTableWidgetItem(item.get("barcode") or "Sin Código")
-            )
-            self.inventory_table.setItem(
-                row, 4, NumericTableWidgetItem(item["quantity"])
-            )
+    @ui_operation(show_dialog=True)
+    def _do_load_inventory(self):
+        """Fetch the filtered inventory on the thread pool."""
+        self._reload_timer.stop()
+        self._load_seq += 1
+        self._busy_cursor_timer.start()
+
+        # Filtering happens in the database; only matching rows come back.
+        worker = QueryWorker(
+            self._load_seq,
+            self.inventory_service.query_inventory,
+            category_id=self.category_filter.currentData(),
+            barcode_mode=self.barcode_filter.currentData(),
+            search=self.search_input.text().strip() or None,
+        )
+        worker.signals.finished.connect(self._on_inventory_loaded)
+        worker.signals.failed.connect(self._on_inventory_load_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    @property
+    def is_loading(self) -> bool:
+        """Whether the latest inventory request has not been applied yet."""
+        return self._loaded_seq != self._load_seq
+
+    def _on_inventory_loaded(self, request_id: int, filtered_items: object):
+        # Results from superseded requests are dropped.
+        if request_id != self._load_seq:
+            return
+        items = cast(List[Dict[str, Any]], filtered_items)
+        self.current_inventory = items
+        self._barcode_index = {
+            item["barcode"]: item for item in items if item.get("barcode")
+        }
+        self._by_product_id = {item["product_id"]: item for item in items}
+        self.update_table(items)
+        self._loaded_seq = request_id
+        self._clear_busy_cursor()
 
-            # Actions
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            actions_layout.setSpacing(6)
-            actions_layout.setAlignment(Qt.AlignCenter)
+    def _on_inventory_load_failed(self, request_id: int, message: str):
+        if request_id != self._load_seq:
+            return
+        self._loaded_seq = request_id
+        self._clear_busy_cursor()
+        show_error_message("Error", f"No se pudo cargar el inventario: {message}")
+
+    def _cancel_pending_loads(self):
+        """Ignore results of in-flight loads and drop any scheduled reload."""
+        self._reload_timer.stop()
+        self._load_seq += 1
+        self._loaded_seq = self._load_seq
+        self._clear_busy_cursor()
+
+    def _show_busy_cursor(self):
+        if not self._busy_cursor_shown:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            self._busy_cursor_shown = True
+
+    def _clear_busy_cursor(self):
+        self._busy_cursor_timer.stop()
+        if self._busy_cursor_shown:
+            QApplication.restoreOverrideCursor()
+            self._busy_cursor_shown = False
 
-            edit_btn = QPushButton("Editar")
-            edit_btn.setFixedWidth(80)
-            edit_btn.setStyleSheet("padding: 2px 8px;")
-            edit_btn.clicked.connect(lambda _, i=item: self.edit_inventory(i))
-            actions_layout.addWidget(edit_btn)
+    def update_table(self, items: List[Dict[str, Any]]):
+        self.inventory_model.set_rows(items)
 
-            self.inventory_table.setCellWidget(row, 5, actions_widget)
-            self.inventory_table.setRowHeight(row, 36)
+    def _item_at(self, proxy_row: int) -> Optional[Dict[str, Any]]:
+        # Map the (possibly sorted) view row straight to the model's backing dict.
+        source_index = self.inventory_proxy.mapToSource(
+            self.inventory_proxy.index(proxy_row, 0)
+        )
+        if not source_index.isValid():
+            return None
+        return self.inventory_model.row_data(source_index.row())
+
+    def on_edit_button_clicked(self, row: int, _position: int = 0):
+        item = self._item_at(row)
+        if item:
+            self.edit_inventory(item)
+
+    def on_table_double_clicked(self, index: QModelIndex):
+        if index.column() != ACTIONS_COLUMN:
+            item = self._item_at(index.row())
+            if item:
+                self.edit_inventory(item)
 
     @ui_operation(show_dialog=True)
     @handle_exceptions(
         ValidationException, DatabaseException, UIException, show_dialog=True
     )
     def edit_inventory(self, item: Dict[str, Any]):
-        dialog = EditInventoryDialog(item, self)
+        # One dialog is reused across edits, e.g. during a stock count.
+        if self._edit_dialog is None:
+            self._edit_dialog = EditInventoryDialog(item, self)
+        else:
+            self._edit_dialog.load(item)
+        dialog = self._edit_dialog
         if dialog.exec():
             data = dialog.get_data()
             if data["adjustment"] != 0:
@@ -279,27 +430,31 @@ class InventoryView(QWidget):
                     product_id=item["product_id"],
                     quantity_change=data["adjustment"],
                 )
-                self.load_inventory()
                 show_info_message("Éxito", "Inventario actualizado correctamente")
 
+    @ui_operation()
+    @handle_exceptions(DatabaseException, UIException, show_dialog=True)
+    def on_inventory_changed(self, product_id: object = None):
+        """Patch the changed product's row instead of reloading the whole table."""
+        if not isinstance(product_id, int) or product_id not in self._by_product_id:
+            self.load_inventory()
+            return
+
+        item = self.inventory_service.get_inventory_item(product_id)
+        if item is None or not self.inventory_model.update_item(item):
+            self.load_inventory()
+
     def handle_barcode_scan(self):
         barcode = self.barcode_input.text().strip()
         if not barcode:
             return
 
-        found = False
-        # Try to find in current list
-        for item in self.current_inventory:
-            if item.get("barcode") == barcode:
-                self.edit_inventory(item)
-                found = True
-                break
-
-        if not found:
+        item = self._barcode_index.get(barcode)
+        if item:
+            self.edit_inventory(item)
+        else:
             # Maybe it's not in current filtered list but exists?
             # Or assume we just search the table.
-            from ui.styles import DesignTokens
-
             self.barcode_input.setStyleSheet(
                 f"background-color: {DesignTokens.COLOR_ERROR_BG};"
             )
@@ -312,11 +467,11 @@ class InventoryView(QWidget):
         self.barcode_input.clear()
 
     def search_products(self):
-        self.load_inventory()
+        self._do_load_inventory()
 
     def refresh(self):
         self.inventory_service.clear_cache()
-        self.load_inventory()
+        self._do_load_inventory()
 
     def show_context_menu(self, position):
         menu = QMenu()
@@ -326,11 +481,7 @@ class InventoryView(QWidget):
         action = menu.exec(self.inventory_table.mapToGlobal(position))
 
         if action == edit_action and row >= 0:
-            product_id = int(self.inventory_table.item(row, 0).text())
-            item = next(
-                (i for i in self.current_inventory if i["product_id"] == product_id),
-                None,
-            )
+            item = self._item_at(row)
             if item:
                 self.edit_inventory(item)
 
@@ -352,11 +503,6 @@ class InventoryView(QWidget):
     def edit_selected_item(self):
         selected_rows = self.inventory_table.selectionModel().selectedRows()
         if selected_rows:
-            row = selected_rows[0].row()
-            product_id = int(self.inventory_table.item(row, 0).text())
-            item = next(
-                (i for i in self.current_inventory if i["product_id"] == product_id),
-                None,
-            )
+            item = self._item_at(selected_rows[0].row())
             if item:
                 self.edit_inventory(item)
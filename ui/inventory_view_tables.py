@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+
+INVENTORY_HEADERS = ("ID", "Producto", "Categoría", "Código", "Cantidad", "Acciones")
+ACTIONS_COLUMN = 5
+NO_CATEGORY_TEXT = "Sin Categoría"
+NO_BARCODE_TEXT = "Sin Código"
+EDIT_ACTION_TEXT = "Editar"
+# Button labels for the actions column, painted by ActionButtonsDelegate.
+ACTION_LABELS_ROLE = Qt.ItemDataRole.UserRole
+INVENTORY_ACTIONS = (EDIT_ACTION_TEXT,)
+INVENTORY_STRETCH_COLUMN = 1
+INVENTORY_COLUMN_WIDTHS = {0: 70, 2: 160, 3: 150, 4: 100, 5: 100}
+
+_NUMERIC_COLUMNS = {0: "product_id", 4: "quantity"}
+_NUMERIC_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class InventoryTableModel(QAbstractTableModel):
+    """Read-only table model serving inventory rows to a QTableView on demand."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._display: List[tuple] = []
+        self._row_by_product_id: Dict[int, int] = {}
+
+    def set_rows(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """Replace all rows, resolving display fallbacks once per row."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._display = [self._build_display_row(item) for item in self._rows]
+        self._row_by_product_id = {
+            item["product_id"]: row for row, item in enumerate(self._rows)
+        }
+        self.endResetModel()
+
+    def update_item(self, item: Dict[str, Any]) -> bool:
+        """
+        Patch the row for `item["product_id"]` in place.
+
+        Returns:
+            bool: False if the product is not currently loaded in the model.
+        """
+        row = self._row_by_product_id.get(item["product_id"])
+        if row is None:
+            return False
+        self._rows[row].update(item)
+        self._display[row] = self._build_display_row(self._rows[row])
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(INVENTORY_HEADERS) - 1)
+        )
+        return True
+
+    def row_data(self, row: int) -> Optional[Dict[str, Any]]:
+        """Return the inventory dict backing a model row, if any."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    @staticmethod
+    def _build_display_row(item: Dict[str, Any]) -> tuple:
+        return (
+            str(item["product_id"]),
+            item["product_name"],
+            item.get("category_name") or NO_CATEGORY_TEXT,
+            item.get("barcode") or NO_BARCODE_TEXT,
+            f"{item['quantity']:.3f}",
+            EDIT_ACTION_TEXT,
+        )
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(INVENTORY_HEADERS)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.row()][index.column()]
+        if role == Qt.ItemDataRole.EditRole:
+            # Raw numbers so the proxy sorts ID and quantity numerically.
+            column = index.column()
+            if column in _NUMERIC_COLUMNS:
+                return self._rows[index.row()][_NUMERIC_COLUMNS[column]]
+            return self._display[index.row()][column]
+        if role == ACTION_LABELS_ROLE and index.column() == ACTIONS_COLUMN:
+            return INVENTORY_ACTIONS
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if index.column() in _NUMERIC_COLUMNS:
+                return _NUMERIC_ALIGNMENT
+            if index.column() == ACTIONS_COLUMN:
+                return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return INVENTORY_HEADERS[section]
+        return super().headerData(section, orientation, role)
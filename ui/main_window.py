@@ -1,6 +1,7 @@
-from typing import Dict, Optional, Protocol, Type, cast
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Protocol, Set, Tuple, Type, Union, cast
 
-from PySide6.QtCore import QPoint, QSettings, QSize
+from PySide6.QtCore import QPoint, QSize, Qt, QThreadPool, QTimer
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -22,14 +23,12 @@ from ui.inventory_view import InventoryView
 from ui.product_view import ProductView
 from ui.purchase_view import PurchaseView
 from ui.sale_view import SaleView
-from utils.decorators import handle_exceptions, ui_operation
+from utils.decorators import handle_exceptions, show_error_dialog, ui_operation
 from utils.exceptions import UIException
 from utils.system.event_system import event_system
 from utils.system.logger import logger
-
-
-class RefreshableWidget(Protocol):
-    def refresh(self) -> None: ...
+from utils.system.settings import CachedSettings
+from utils.ui.workers import QueryWorker
 
 
 class ExportableWidget(Protocol):
@@ -80,21 +79,94 @@ PURCHASE_REFRESH_TARGETS = (
     ANALYTICS_TAB,
     AUDIT_TAB,
 )
+# The inventory view patches its own rows on inventory_changed.
 INVENTORY_REFRESH_TARGETS = (
     DASHBOARD_TAB,
     SALES_TAB,
     PURCHASES_TAB,
-    INVENTORY_TAB,
     AUDIT_TAB,
 )
 
+# Tab order is fixed; TAB_SHORTCUT_KEYS and the saved LastTabIndex rely on it.
+TABS: Tuple[Tuple[str, Type[QWidget]], ...] = (
+    (DASHBOARD_TAB, DashboardView),
+    (CUSTOMERS_TAB, CustomerView),
+    (PRODUCTS_TAB, ProductView),
+    (SALES_TAB, SaleView),
+    (PURCHASES_TAB, PurchaseView),
+    (INVENTORY_TAB, InventoryView),
+    (ANALYTICS_TAB, AnalyticsView),
+    (AUDIT_TAB, AuditLogView),
+)
+
+# Global navigation keys. Keys unhandled by the focused view reach the main
+# window's keyPressEvent, so view-level shortcuts on the same key win.
+TAB_SHORTCUT_KEYS = {
+    Qt.Key.Key_F1: 3,  # Sales
+    Qt.Key.Key_F2: 5,  # Inventory
+    Qt.Key.Key_F3: 2,  # Products
+    Qt.Key.Key_F4: 1,  # Customers
+    Qt.Key.Key_F5: 0,  # Dashboard
+    Qt.Key.Key_F6: 4,  # Purchases
+    Qt.Key.Key_F7: 6,  # Analytics
+    Qt.Key.Key_F8: 7,  # Audit log
+}
+
+
+# (menu name, ((action name, shortcut, MainWindow method name), ...))
+MENU_SPEC = (
+    (
+        "&Archivo",
+        (
+            ("&Exportar Datos", "Ctrl+E", "export_data"),
+            ("&Importar Datos", "Ctrl+I", "import_data"),
+            ("&Crear Copia de Seguridad", None, "backup_data"),
+            ("&Salir", QKeySequence.StandardKey.Quit, "close"),
+        ),
+    ),
+    (
+        "&Ver",
+        (("&Actualizar", QKeySequence.StandardKey.Refresh, "refresh_current_tab"),),
+    ),
+    (
+        "&Ayuda",
+        (
+            (
+                "&Guía de Usuario",
+                QKeySequence.StandardKey.HelpContents,
+                "show_user_guide",
+            ),
+            ("&Acerca de", None, "show_about_dialog"),
+        ),
+    ),
+)
+
+
+@lru_cache(maxsize=None)
+def _key_sequence(shortcut: Union[str, QKeySequence.StandardKey]) -> QKeySequence:
+    """Parse each menu shortcut once per process."""
+    return QKeySequence(shortcut)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{APP_NAME} - v{APP_VERSION}")
-        self.settings = QSettings(COMPANY_NAME, APP_NAME)
+        self.settings = CachedSettings(COMPANY_NAME, APP_NAME)
         self.views_by_name: Dict[str, QWidget] = {}
+        self._tab_factories: Dict[int, Type[QWidget]] = {}
+        # Refresh callables by tab name, registered as each view is built.
+        self._refreshers: Dict[str, Callable[[], None]] = {}
+        self._last_tab_index = -1
+        # Hidden tabs with stale data, refreshed when the user switches to them.
+        self._dirty_tabs: Set[str] = set()
+        self._backup_running = False
+        # Bursts of data events collapse into one refresh per affected tab.
+        self._pending_refresh_targets: Set[str] = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh_relevant_views)
         self.setup_ui()
 
     @ui_operation(show_dialog=True)
@@ -115,9 +187,9 @@ class MainWindow(QMainWindow):
             else:
                 self.move(QPoint(100, 100))
 
-            self.setup_menu_bar()
+            # Menus are not needed for the first paint; build them right after.
+            QTimer.singleShot(0, self, self.setup_menu_bar)
             self.setup_status_bar()
-            self.setup_global_shortcuts()
 
             central_widget = QWidget()
             self.setCentralWidget(central_widget)
@@ -137,67 +209,32 @@ class MainWindow(QMainWindow):
         menu_bar = QMenuBar(self)
         self.setMenuBar(menu_bar)
 
-        file_menu = self.create_menu(
-            "&Archivo",
-            [
-                ("&Exportar Datos", "Ctrl+E", self.export_data),
-                ("&Importar Datos", "Ctrl+I", self.import_data),
-                ("&Crear Copia de Seguridad", None, self.backup_data),
-                ("&Salir", QKeySequence.StandardKey.Quit, self.close),
-            ],
-        )
-        view_menu = self.create_menu(
-            "&Ver",
-            [
-                (
-                    "&Actualizar",
-                    QKeySequence.StandardKey.Refresh,
-                    self.refresh_current_tab,
-                )
-            ],
-        )
-        help_menu = self.create_menu(
-            "&Ayuda",
-            [
-                (
-                    "&Guía de Usuario",
-                    QKeySequence.StandardKey.HelpContents,
-                    self.show_user_guide,
-                ),
-                ("&Acerca de", None, self.show_about_dialog),
-            ],
-        )
-
-        menu_bar.addMenu(file_menu)
-        menu_bar.addMenu(view_menu)
-        menu_bar.addMenu(help_menu)
+        for menu_name, action_specs in MENU_SPEC:
+            actions = [
+                (action_name, shortcut, getattr(self, callback_name))
+                for action_name, shortcut, callback_name in action_specs
+            ]
+            menu_bar.addMenu(self.create_menu(menu_name, actions))
 
     def setup_status_bar(self):
         self.status_bar = QStatusBar(self)
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Listo")
 
-    def setup_global_shortcuts(self):
-        """Setup global keyboard shortcuts for navigation."""
-        shortcuts = {
-            "F1": 3,  # Sales (mapped to index 3 in create_tabs)
-            "F2": 5,  # Inventory (mapped to index 5 in create_tabs)
-            "F3": 2,  # Products (mapped to index 2 in create_tabs)
-            "F4": 1,  # Customers (mapped to index 1 in create_tabs)
-            "F5": 0,  # Dashboard (mapped to index 0 in create_tabs)
-            "F6": 4,  # Purchases (mapped to index 4 in create_tabs)
-            "F7": 6,  # Analytics
-            "F8": 7,  # Audit log
-        }
-
-        for key, index in shortcuts.items():
-            action = QAction(self)
-            action.setShortcut(QKeySequence(key))
-            # Use default argument capture to bind the specific index
-            action.triggered.connect(
-                lambda checked=False, idx=index: self.switch_to_tab(idx)
-            )
-            self.addAction(action)
+    def keyPressEvent(self, event):
+        """Switch tabs with the F-key navigation shortcuts."""
+        index = TAB_SHORTCUT_KEYS.get(event.key())
+        if index is not None and event.modifiers() == Qt.KeyboardModifier.NoModifier:
+            # Build the view first so on_tab_changed finds it ready.
+            try:
+                self.ensure_tab_view(index)
+            except UIException as e:
+                # ensure_tab_view has logged the failure; stay on this tab.
+                show_error_dialog("Operation Failed", str(e), self)
+                return
+            self.tab_widget.setCurrentIndex(index)
+            return
+        super().keyPressEvent(event)
 
     @ui_operation()
     def switch_to_tab(self, index: int):
@@ -208,25 +245,22 @@ class MainWindow(QMainWindow):
     @handle_exceptions(UIException, show_dialog=True)
     def create_tabs(self):
         try:
-            tabs: Dict[str, Type[QWidget]] = {
-                DASHBOARD_TAB: DashboardView,
-                CUSTOMERS_TAB: CustomerView,
-                PRODUCTS_TAB: ProductView,
-                SALES_TAB: SaleView,
-                PURCHASES_TAB: PurchaseView,
-                INVENTORY_TAB: InventoryView,
-                ANALYTICS_TAB: AnalyticsView,
-                AUDIT_TAB: AuditLogView,
-            }
-
+            # Views are built the first time their tab is shown; until then the
+            # tab holds an empty placeholder and is absent from views_by_name.
             self.views_by_name = {}
-            for tab_name, view_class in tabs.items():
-                view = view_class()
-                self.views_by_name[tab_name] = view
-                self.tab_widget.addTab(view, tab_name)
-                logger.info(f"Added {tab_name} tab successfully")
-
-            self.restore_last_tab()
+            self._tab_factories = {}
+            # Paint the tab widget once, after the first view is in place.
+            self.tab_widget.setUpdatesEnabled(False)
+            try:
+                for index, (tab_name, view_class) in enumerate(TABS):
+                    self.tab_widget.addTab(QWidget(), tab_name)
+                    self._tab_factories[index] = view_class
+                    logger.info(f"Added {tab_name} tab successfully")
+
+                self.restore_last_tab()
+                self.ensure_tab_view(self.tab_widget.currentIndex())
+            finally:
+                self.tab_widget.setUpdatesEnabled(True)
             self.tab_widget.currentChanged.connect(self.on_tab_changed)
 
             self.connect_to_events()
@@ -244,27 +278,75 @@ class MainWindow(QMainWindow):
         else:
             self.tab_widget.setCurrentIndex(0)
 
+    def ensure_tab_view(self, index: int) -> Optional[QWidget]:
+        """Return the view at `index`, building it if it is still a placeholder."""
+        view_class = self._tab_factories.get(index)
+        if view_class is None:
+            return self.tab_widget.widget(index)
+
+        tab_name = self.tab_widget.tabText(index)
+        was_current = self.tab_widget.currentIndex() == index
+        try:
+            view = view_class()
+        except Exception as e:
+            # Keep the factory so the tab can be retried on the next visit.
+            logger.error(f"Error creating {tab_name} view: {str(e)}")
+            raise UIException(f"Failed to create {tab_name} view: {str(e)}")
+        del self._tab_factories[index]
+        placeholder = self.tab_widget.widget(index)
+
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, view, tab_name)
+            if was_current:
+                self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+
+        placeholder.deleteLater()
+        self.views_by_name[tab_name] = view
+        refresh = getattr(view, "refresh", None)
+        if callable(refresh):
+            self._refreshers[tab_name] = refresh
+        logger.info(f"Created {tab_name} view on first use")
+        return view
+
     def connect_to_events(self):
-        event_system.connect_to_event("product_added", self.on_product_added)
-        event_system.connect_to_event("product_updated", self.on_product_updated)
-        event_system.connect_to_event("product_deleted", self.on_product_deleted)
-        event_system.connect_to_event("customer_added", self.on_customer_changed)
-        event_system.connect_to_event("customer_updated", self.on_customer_changed)
-        event_system.connect_to_event("customer_deleted", self.on_customer_changed)
-        event_system.connect_to_event("sale_added", self.on_sale_added)
-        event_system.connect_to_event("sale_updated", self.on_sale_changed)
-        event_system.connect_to_event("sale_deleted", self.on_sale_changed)
-        event_system.connect_to_event("purchase_added", self.on_purchase_added)
-        event_system.connect_to_event("purchase_updated", self.on_purchase_changed)
-        event_system.connect_to_event("purchase_deleted", self.on_purchase_changed)
-        event_system.connect_to_event("inventory_changed", self.on_inventory_changed)
-        event_system.connect_to_event("backup_skipped", self.on_backup_skipped)
+        # Queued: handlers run on the GUI thread after the emitting operation
+        # returns, including for events emitted from worker threads.
+        handlers = (
+            ("product_added", self.on_product_added),
+            ("product_updated", self.on_product_updated),
+            ("product_deleted", self.on_product_deleted),
+            ("customer_added", self.on_customer_changed),
+            ("customer_updated", self.on_customer_changed),
+            ("customer_deleted", self.on_customer_changed),
+            ("sale_added", self.on_sale_added),
+            ("sale_updated", self.on_sale_changed),
+            ("sale_deleted", self.on_sale_changed),
+            ("purchase_added", self.on_purchase_added),
+            ("purchase_updated", self.on_purchase_changed),
+            ("purchase_deleted", self.on_purchase_changed),
+            ("inventory_changed", self.on_inventory_changed),
+            ("backup_skipped", self.on_backup_skipped),
+        )
+        for event_name, handler in handlers:
+            event_system.connect_to_event(
+                event_name, handler, Qt.ConnectionType.QueuedConnection
+            )
 
     @ui_operation(show_dialog=True)
     def on_tab_changed(self, index):
-        self.settings.setValue("LastTabIndex", index)
+        if index == self._last_tab_index:
+            return
+        self.ensure_tab_view(index)
+        self._last_tab_index = index
         tab_name = self.tab_widget.tabText(index)
-        self.status_bar.showMessage(f"Vista actual: {tab_name}")
+        if tab_name in self._dirty_tabs:
+            self._dirty_tabs.discard(tab_name)
+            self._refreshers[tab_name]()
+        self.show_status_message(f"Vista actual: {tab_name}", timeout=0)
 
     @ui_operation(show_dialog=True)
     def show_about_dialog(self):
@@ -289,6 +371,9 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.settings.setValue("WindowSize", self.size())
             self.settings.setValue("WindowPosition", self.pos())
+            # Only the final tab matters; it is recorded once, on exit.
+            self.settings.setValue("LastTabIndex", self.tab_widget.currentIndex())
+            self.settings.flush()
 
             logger.info("Application closed by user")
             event.accept()
@@ -296,42 +381,37 @@ class MainWindow(QMainWindow):
             event.ignore()
 
     def show_status_message(self, message: str, timeout: int = 5000):
+        # Repeated events often post the same text; skip the repaint.
+        if self.status_bar.currentMessage() == message:
+            return
         self.status_bar.showMessage(message, timeout)
 
-    @ui_operation(show_dialog=True)
     def on_product_added(self, product_id: int):
         self.show_status_message(f"Producto agregado (ID: {product_id})")
         self.refresh_relevant_views(PRODUCT_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
     def on_product_updated(self, product_id: int):
         self.show_status_message(f"Producto actualizado (ID: {product_id})")
         self.refresh_relevant_views(PRODUCT_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
     def on_product_deleted(self, product_id: int):
         self.show_status_message(f"Producto eliminado (ID: {product_id})")
         self.refresh_relevant_views(PRODUCT_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
     def on_customer_changed(self, _payload: object = None):
         self.refresh_relevant_views(CUSTOMER_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
     def on_sale_added(self, sale_id: int):
         self.show_status_message(f"Venta agregada (ID: {sale_id})")
         self.refresh_relevant_views(SALE_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
     def on_sale_changed(self, _payload: object = None):
         self.refresh_relevant_views(SALE_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
     def on_purchase_added(self, purchase_id: int):
         self.show_status_message(f"Compra agregada (ID: {purchase_id})")
         self.refresh_relevant_views(PURCHASE_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
     def on_purchase_changed(self, _payload: object = None):
         self.refresh_relevant_views(PURCHASE_REFRESH_TARGETS)
 
@@ -342,30 +422,47 @@ class MainWindow(QMainWindow):
         # Keep visible longer to increase operator awareness.
         self.show_status_message(message, timeout=15000)
 
-    @ui_operation(show_dialog=True)
     def on_inventory_changed(self, _payload: object = None):
         self.refresh_relevant_views(INVENTORY_REFRESH_TARGETS)
 
-    @ui_operation(show_dialog=True)
-    @handle_exceptions(UIException, show_dialog=True)
     def refresh_relevant_views(
         self, target_tab_names: Optional[tuple[str, ...]] = None
     ):
-        try:
-            if target_tab_names is None:
-                target_tab_names = tuple(self.views_by_name.keys())
+        """Queue a refresh of `target_tab_names` (all tabs if None)."""
+        if target_tab_names is None:
+            target_tab_names = tuple(
+                self.tab_widget.tabText(index)
+                for index in range(self.tab_widget.count())
+            )
+        self._pending_refresh_targets.update(target_tab_names)
+        self._refresh_timer.start()
 
-            refreshed_tabs = set()
+    @ui_operation(show_dialog=True)
+    @handle_exceptions(UIException, show_dialog=True)
+    def _do_refresh_relevant_views(self):
+        pending = self._pending_refresh_targets
+        self._pending_refresh_targets = set()
+        # Walk the targets in tab order, not in the set's arbitrary order.
+        target_tab_names = [name for name, _view_class in TABS if name in pending]
+        current_tab_name = self.tab_widget.tabText(self.tab_widget.currentIndex())
+        handled = 0
+        try:
             for tab_name in target_tab_names:
-                if tab_name in refreshed_tabs:
+                handled += 1
+                # Tabs that were never opened have nothing to refresh yet.
+                refresh = self._refreshers.get(tab_name)
+                if refresh is None:
                     continue
-                refreshed_tabs.add(tab_name)
-
-                widget = self.views_by_name.get(tab_name)
-                if hasattr(widget, "refresh") and callable(getattr(widget, "refresh")):
-                    refreshable_widget = cast(RefreshableWidget, widget)
-                    refreshable_widget.refresh()
+                if tab_name == current_tab_name:
+                    refresh()
+                else:
+                    self._dirty_tabs.add(tab_name)
         except Exception as e:
+            # Queue the targets the failed refresh kept from running again.
+            remaining = target_tab_names[handled:]
+            if remaining:
+                self._pending_refresh_targets.update(remaining)
+                self._refresh_timer.start()
             logger.error(f"Error refreshing views: {str(e)}")
             raise UIException(f"Failed to refresh views: {str(e)}")
 
@@ -374,10 +471,7 @@ class MainWindow(QMainWindow):
         for action_name, shortcut, callback in actions:
             action = QAction(action_name, self)
             if shortcut:
-                if isinstance(shortcut, QKeySequence.StandardKey):
-                    action.setShortcut(QKeySequence(shortcut))
-                else:
-                    action.setShortcut(shortcut)
+                action.setShortcut(_key_sequence(shortcut))
             action.triggered.connect(callback)
             menu.addAction(action)
         return menu
@@ -403,39 +497,51 @@ class MainWindow(QMainWindow):
     def backup_data(self):
         from services.backup_service import backup_service
 
-        try:
-            self.show_status_message("Creando copia de seguridad...")
-            backup_path = backup_service.create_backup()
-            if backup_path:
-                QMessageBox.information(
-                    self,
-                    "Copia de Seguridad Exitosa",
-                    f"Copia de seguridad creada en:\n{backup_path}",
-                )
-                self.show_status_message("Copia de seguridad creada exitosamente")
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Error de Copia de Seguridad",
-                    "Error al crear la copia de seguridad. Revise los registros para más detalles.",
-                )
-                self.show_status_message("Fallo en la copia de seguridad")
-        except Exception as e:
-            logger.error(f"Manual backup error: {e}")
-            QMessageBox.critical(
-                self, "Error en Copia de Seguridad", f"Ha ocurrido un error: {e}"
+        if self._backup_running:
+            self.show_status_message("Ya hay una copia de seguridad en curso")
+            return
+
+        # The copy scales with the database size; keep the UI responsive.
+        self._backup_running = True
+        self.show_status_message("Creando copia de seguridad...")
+        worker = QueryWorker(0, backup_service.create_backup)
+        worker.signals.finished.connect(self._on_backup_finished)
+        worker.signals.failed.connect(self._on_backup_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_backup_finished(self, _request_id: int, backup_path: Optional[str]):
+        self._backup_running = False
+        if backup_path:
+            QMessageBox.information(
+                self,
+                "Copia de Seguridad Exitosa",
+                f"Copia de seguridad creada en:\n{backup_path}",
             )
+            self.show_status_message("Copia de seguridad creada exitosamente")
+        else:
+            QMessageBox.warning(
+                self,
+                "Error de Copia de Seguridad",
+                "Error al crear la copia de seguridad. Revise los registros para más detalles.",
+            )
+            self.show_status_message("Fallo en la copia de seguridad")
+
+    def _on_backup_failed(self, _request_id: int, error: str):
+        self._backup_running = False
+        logger.error(f"Manual backup error: {error}")
+        QMessageBox.critical(
+            self, "Error en Copia de Seguridad", f"Ha ocurrido un error: {error}"
+        )
 
     @ui_operation(show_dialog=True)
     @handle_exceptions(UIException, show_dialog=True)
     def refresh_current_tab(self):
         try:
-            current_widget = self.tab_widget.currentWidget()
-            if hasattr(current_widget, "refresh") and callable(
-                getattr(current_widget, "refresh")
-            ):
-                refreshable_widget = cast(RefreshableWidget, current_widget)
-                refreshable_widget.refresh()
+            tab_name = self.tab_widget.tabText(self.tab_widget.currentIndex())
+            refresh = self._refreshers.get(tab_name)
+            if refresh is not None:
+                self._dirty_tabs.discard(tab_name)
+                refresh()
             self.show_status_message("Vista actualizada")
         except Exception as e:
             logger.error(f"Error refreshing current tab: {str(e)}")
@@ -1,12 +1,14 @@
-from typing import Any, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QAction, QKeySequence
+from PySide6.QtCore import QStringListModel, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QAction, QKeySequence, QStandardItemModel
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
     QCheckBox,
     QComboBox,
+    QCompleter,
     QDialog,
     QDialogButtonBox,
     QDoubleSpinBox,
@@ -17,86 +19,92 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMenu,
     QMessageBox,
-    QProgressBar,
     QPushButton,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
 from models.category import Category
 from models.product import Product
-from services.category_service import CategoryService
-from services.product_service import ProductService
+from services.category_service import category_service
+from services.product_service import ProductService, product_service
 from ui.category_management_dialog import CategoryManagementDialog
+from ui.product_view_tables import (
+    ACTION_LABELS_ROLE,
+    ACTIONS_COLUMN,
+    DELETE_ACTION_TEXT,
+    PRODUCT_COLUMN_WIDTHS,
+    PRODUCT_PAGE_SIZE,
+    RESTORE_ACTION_TEXT,
+    ProductFilterProxyModel,
+    ProductTableModel,
+)
 from utils.decorators import handle_exceptions, ui_operation
 from utils.exceptions import (
     DatabaseException,
-    NotFoundException,
     UIException,
     ValidationException,
 )
 from utils.helpers import (
-    create_table,
-    format_price,
+    create_combo_model,
+    create_table_view,
     show_error_message,
     show_info_message,
 )
 from utils.system.event_system import event_system
 from utils.system.logger import logger
-from utils.ui.table_items import (
-    NumericTableWidgetItem,
-    PercentageTableWidgetItem,
-    PriceTableWidgetItem,
-)
+from utils.ui.delegates import ActionButtonsDelegate
+from utils.ui.workers import QueryWorker
 from utils.validation.validators import validate_float, validate_string
 
+# Names offered by the search field's completer for one search term.
+NAME_SUGGESTION_LIMIT = 20
+
+
+def _category_model(
+    first_text: str, categories: List[Category], parent
+) -> QStandardItemModel:
+    """Build a complete combo model: `first_text` (no id) and the categories."""
+    return create_combo_model(
+        [
+            (first_text, None),
+            *((category.name, category.id) for category in categories),
+        ],
+        parent,
+    )
+
+
+def _category_rows(categories: List[Category]) -> Dict[Optional[int], int]:
+    """Map category ids to their row in a `_category_model` combo."""
+    rows: Dict[Optional[int], int] = {None: 0}
+    for row, category in enumerate(categories, start=1):
+        rows[category.id] = row
+    return rows
+
 
 class EditProductDialog(QDialog):
     def __init__(
         self, product: Optional[Product], categories: List[Category], parent=None
     ):
         super().__init__(parent)
-        self.product = product
-        self.categories = categories
-        self.setWindowTitle("Editar Producto" if product else "Agregar Producto")
+        self._categories_key: Optional[tuple] = None
+        self._category_rows: Dict[Optional[int], int] = {None: 0}
         self.setup_ui()
+        self.reset(product, categories)
 
     def setup_ui(self):
         layout = QFormLayout(self)
 
-        self.name_input = QLineEdit(self.product.name if self.product else "")
-        self.description_input = QLineEdit(
-            self.product.description or "" if self.product else ""
-        )
-        self.barcode_input = QLineEdit(
-            self.product.barcode or "" if self.product else ""
-        )
-
+        self.name_input = QLineEdit()
+        self.description_input = QLineEdit()
+        self.barcode_input = QLineEdit()
         self.category_combo = QComboBox()
-        self.category_combo.addItem("Sin Categoría", None)
-        for category in self.categories:
-            self.category_combo.addItem(category.name, category.id)
-        if self.product and self.product.category_id:
-            index = self.category_combo.findData(self.product.category_id)
-            if index >= 0:
-                self.category_combo.setCurrentIndex(index)
 
         self.cost_price_input = QDoubleSpinBox()
         self.cost_price_input.setMaximum(1000000000)
-        self.cost_price_input.setValue(
-            float(self.product.cost_price)
-            if self.product and self.product.cost_price
-            else 0
-        )
 
         self.sell_price_input = QDoubleSpinBox()
         self.sell_price_input.setMaximum(1000000000)
-        self.sell_price_input.setValue(
-            float(self.product.sell_price)
-            if self.product and self.product.sell_price
-            else 0
-        )
 
         layout.addRow("Nombre:", self.name_input)
         layout.addRow("Descripción:", self.description_input)
@@ -119,6 +127,42 @@ class EditProductDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addRow(self.button_box)
 
+    def reset(self, product: Optional[Product], categories: List[Category]) -> None:
+        """
+        Load `product` (or blank fields when adding) into the dialog.
+
+        The category combo is only rebuilt when the categories changed, so the
+        same dialog can be reopened cheaply for every add or edit.
+        """
+        self.product = product
+        self.categories = categories
+        self.product_data: Dict[str, Any] = {}
+        self.setWindowTitle("Editar Producto" if product else "Agregar Producto")
+
+        self.name_input.setText(product.name if product else "")
+        self.description_input.setText(product.description or "" if product else "")
+        self.barcode_input.setText(product.barcode or "" if product else "")
+
+        categories_key = tuple((category.id, category.name) for category in categories)
+        if categories_key != self._categories_key:
+            # Hand the combo a complete model instead of inserting item by item.
+            self.category_combo.setModel(
+                _category_model("Sin Categoría", categories, self.category_combo)
+            )
+            self._category_rows = _category_rows(categories)
+            self._categories_key = categories_key
+        self.category_combo.setCurrentIndex(
+            self._category_rows.get(product.category_id, 0) if product else 0
+        )
+
+        self.cost_price_input.setValue(
+            float(product.cost_price) if product and product.cost_price else 0
+        )
+        self.sell_price_input.setValue(
+            float(product.sell_price) if product and product.sell_price else 0
+        )
+        self.name_input.setFocus()
+
     @ui_operation(show_dialog=True)
     @handle_exceptions(ValidationException, show_dialog=True)
     def validate_and_accept(self):
@@ -155,9 +199,30 @@ class ProductView(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.product_service = ProductService()
-        self.category_service = CategoryService()
+        self.product_service = product_service
+        self.category_service = category_service
         self.current_category_id = None
+        self._category_signature: Optional[tuple] = None
+        # Kept current by load_categories, which runs on every category event.
+        self._categories: List[Category] = []
+        self._search_term = ""
+        self._loaded_filters: Optional[Tuple[str, Optional[int], bool]] = None
+        self._edit_dialog: Optional[EditProductDialog] = None
+        self._confirm_box: Optional[QMessageBox] = None
+        # Collapse bursts of reload requests (events, F5, toggles) into one load.
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(150)
+        self._reload_timer.timeout.connect(self._do_load_products)
+        # Only show the wait cursor for loads that are actually slow.
+        self._busy_cursor_timer = QTimer(self)
+        self._busy_cursor_timer.setSingleShot(True)
+        self._busy_cursor_timer.setInterval(150)
+        self._busy_cursor_timer.timeout.connect(self._show_busy_cursor)
+        self._busy_cursor_shown = False
+        self._load_seq = 0
+        self._loaded_seq = 0
+        self._suggestion_seq = 0
         self.setup_ui()
 
     def setup_ui(self):
@@ -168,6 +233,12 @@ class ProductView(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Buscar productos...")
         self.search_input.returnPressed.connect(self.search_products)
+        # Typing filters in place once the user pauses.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.search_products)
+        self.search_input.textChanged.connect(self._search_timer.start)
         search_button = QPushButton("Buscar")
         search_button.clicked.connect(self.search_products)
         self.show_archived_checkbox = QCheckBox("Mostrar archivados")
@@ -180,7 +251,6 @@ class ProductView(QWidget):
         # Category filter
         filter_layout = QHBoxLayout()
         self.category_filter = QComboBox()
-        self.category_filter.addItem("Todas las Categorías", None)
         self.load_categories()
         self.category_filter.currentIndexChanged.connect(self.on_category_changed)
         filter_layout.addWidget(QLabel("Filtrar por Categoría:"))
@@ -188,29 +258,44 @@ class ProductView(QWidget):
         layout.addLayout(filter_layout)
 
         # Product table
-        self.product_table = create_table(
-            [
-                "ID",
-                "Nombre",
-                "Descripción",
-                "Categoría",
-                "Estado",
-                "Precio Costo",
-                "Precio Venta",
-                "Margen Ganancia",
-                "Acciones",
-            ]
-        )
-        self.product_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Interactive
-        )
+        # Rows are served lazily by the model; the proxy sorts and filters them.
+        self.product_model = ProductTableModel(self)
+        self.product_model.page_requested.connect(self._request_product_page)
+        self.product_proxy = ProductFilterProxyModel(self)
+        self.product_proxy.setSourceModel(self.product_model)
+        self.product_table = create_table_view(self.product_proxy)
+        # Name suggestions have their own small model, refilled from the
+        # debounced search term, so completing never pages in the catalog.
+        self._name_suggestions = QStringListModel(self)
+        name_completer = QCompleter(self._name_suggestions, self)
+        name_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        name_completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.search_input.setCompleter(name_completer)
+        # Fixed widths avoid measuring every cell whenever the rows change;
+        # the actions column takes the remaining space.
+        header = self.product_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in PRODUCT_COLUMN_WIDTHS.items():
+            self.product_table.setColumnWidth(column, width)
+        header.setSectionResizeMode(ACTIONS_COLUMN, QHeaderView.ResizeMode.Stretch)
         self.product_table.setSortingEnabled(True)
+        # Pages arrive in ID order, so that is the only order the loaded rows
+        # can show correctly; other sorts load the rest of the catalog first.
+        self.product_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        header.sortIndicatorChanged.connect(self._on_sort_changed)
         self.product_table.setSelectionBehavior(
             QAbstractItemView.SelectionBehavior.SelectRows
         )
         self.product_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.product_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.product_table.customContextMenuRequested.connect(self.show_context_menu)
+        self.product_table.verticalHeader().setDefaultSectionSize(36)
+        # Edit/archive buttons are painted by a delegate instead of widgets per row.
+        self._actions_delegate = ActionButtonsDelegate(ACTION_LABELS_ROLE, self)
+        self._actions_delegate.clicked.connect(self.on_action_button_clicked)
+        self.product_table.setItemDelegateForColumn(
+            ACTIONS_COLUMN, self._actions_delegate
+        )
         layout.addWidget(self.product_table)
 
         # Buttons
@@ -224,22 +309,15 @@ class ProductView(QWidget):
         button_layout.addWidget(manage_categories_button)
         layout.addLayout(button_layout)
 
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
-
         # Set up shortcuts
         self.setup_shortcuts()
 
-        self.load_products()
+        # The first load starts right away; later reloads are debounced.
+        self._do_load_products()
 
         # Connect to event system
-        event_system.product_added.connect(self.load_products)
-        event_system.product_updated.connect(self.load_products)
-        event_system.product_deleted.connect(self.load_products)
+        for signal, handler in self._event_handlers():
+            signal.connect(handler)
 
     def setup_shortcuts(self):
         add_shortcut = QAction("Agregar Producto", self)
@@ -259,11 +337,7 @@ class ProductView(QWidget):
     def on_category_changed(self, index):
         try:
             self.current_category_id = self.category_filter.itemData(index)
-            # Get fresh data and apply new filter
-            fresh_products = self.product_service.get_all_products(
-                active_only=not self.show_archived_checkbox.isChecked()
-            )
-            self.filter_products(products=fresh_products)
+            self.filter_products()
         except Exception as e:
             logger.error(f"Error changing category: {str(e)}")
             raise UIException(f"Failed to change category: {str(e)}")
@@ -272,134 +346,209 @@ class ProductView(QWidget):
     @handle_exceptions(DatabaseException, UIException, show_dialog=True)
     def load_categories(self):
         try:
+            # get_all_categories is cached by the service; only rebuild the
+            # combo when the category list actually changed.
             categories = self.category_service.get_all_categories()
-            self.category_filter.clear()
-            self.category_filter.addItem("Todas las Categorías", None)
-            for category in categories:
-                self.category_filter.addItem(category.name, category.id)
+            self._categories = categories
+            signature = tuple((category.id, category.name) for category in categories)
+            if signature == self._category_signature:
+                return
+
+            self.category_filter.blockSignals(True)
+            self.category_filter.setModel(
+                _category_model(
+                    "Todas las Categorías", categories, self.category_filter
+                )
+            )
+            self.category_filter.setCurrentIndex(
+                max(self.category_filter.findData(self.current_category_id), 0)
+            )
+            self.category_filter.blockSignals(False)
+            # The selected category may be gone; fall back to all categories.
+            self.current_category_id = self.category_filter.currentData()
+            self._category_signature = signature
             logger.info("Categories loaded successfully")
         except Exception as e:
             logger.error(f"Error loading categories: {str(e)}")
             raise DatabaseException(f"Error al cargar categorías: {str(e)}")
 
-    @ui_operation(show_dialog=True)
-    @handle_exceptions(DatabaseException, UIException, show_dialog=True)
+    def on_categories_changed(self, _payload: object = None):
+        self.load_categories()
+        # Category names are shown in the table and the selected one may be gone.
+        self.load_products()
+
     def load_products(self, _: Any = None) -> None:
-        """Load all products and maintain current filters."""
-        logger.debug("Loading products list")
-        try:
-            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-            fresh_products = self.product_service.get_all_products(
-                active_only=not self.show_archived_checkbox.isChecked()
-            )
-            logger.debug(f"Loaded {len(fresh_products)} products")
-            # Use filter_products to maintain current filters
-            self.filter_products(products=fresh_products)
-            logger.info("Products loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading products: {str(e)}")
-            raise DatabaseException(f"Error al cargar productos: {str(e)}")
-        finally:
-            QApplication.restoreOverrideCursor()
+        """Schedule a debounced reload of the product table."""
+        self._reload_timer.start()
 
-    @ui_operation(show_dialog=True)
-    @handle_exceptions(UIException, show_dialog=True)
-    def update_product_table(self, products: List[Product]):
-        """Update the product table display."""
-        logger.debug(f"Updating product table with {len(products)} products")
-        try:
+    def _do_load_products(self) -> None:
+        """Reload products from the database, keeping the current filters."""
+        self._reload_timer.stop()
+        logger.debug("Loading products list")
+        self._load_product_pages()
+        self.product_proxy.set_filters(self._search_term, self.current_category_id)
+
+    def _load_product_pages(self) -> None:
+        """Count the matching products and fetch the first page off the UI thread."""
+        self._loaded_filters = (
+            self._search_term,
+            self.current_category_id,
+            not self.show_archived_checkbox.isChecked(),
+        )
+        self._load_seq += 1
+        self._busy_cursor_timer.start()
+
+        worker = QueryWorker(
+            self._load_seq,
+            self._fetch_first_page,
+            self.product_service,
+            *self._loaded_filters,
+        )
+        worker.signals.finished.connect(self._on_products_loaded)
+        worker.signals.failed.connect(self._on_products_load_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def _fetch_first_page(
+        service: ProductService,
+        search_term: str,
+        category_id: Optional[int],
+        active_only: bool,
+    ) -> Tuple[int, List[Product]]:
+        # Runs on a pool thread. The worker is destroyed there too, so it must
+        # not hold the last reference to this widget: no bound methods.
+        total = service.count_products(search_term, category_id, active_only)
+        if not total:
+            return total, []
+        first_page = service.get_products_page(
+            0,
+            PRODUCT_PAGE_SIZE,
+            search_term=search_term,
+            category_id=category_id,
+            active_only=active_only,
+        )
+        return total, first_page
+
+    @property
+    def is_loading(self) -> bool:
+        """Whether a reload is scheduled or its result has not been applied yet."""
+        return self._reload_timer.isActive() or self._loaded_seq != self._load_seq
+
+    def _on_products_loaded(self, request_id: int, result: object):
+        # Results from superseded requests are dropped.
+        if request_id != self._load_seq or self._loaded_filters is None:
+            return
+        total, first_page = cast(Tuple[int, List[Product]], result)
+        # Only the first page is loaded now; the model requests the rest as
+        # the table scrolls.
+        self.product_model.set_page_source(None, total, first_page)
+        self._loaded_seq = request_id
+        self._clear_busy_cursor()
+        logger.info(f"Products loaded: {total} matching products")
+
+    def _request_product_page(self, after_id: int, limit: int):
+        """Fetch the next page of the current catalog on the thread pool."""
+        if self._loaded_filters is None:
+            return
+        search_term, category_id, active_only = self._loaded_filters
+        worker = QueryWorker(
+            self._load_seq,
+            self.product_service.get_products_page,
+            after_id,
+            limit,
+            search_term=search_term,
+            category_id=category_id,
+            active_only=active_only,
+        )
+        worker.signals.finished.connect(self._on_product_page_loaded)
+        worker.signals.failed.connect(self._on_product_page_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_product_page_loaded(self, request_id: int, page: object):
+        # Pages for a catalog that has since been reloaded are dropped.
+        if request_id != self._load_seq:
+            return
+        self.product_model.add_page(cast(List[Product], page))
+
+    def _on_product_page_failed(self, request_id: int, message: str):
+        if request_id != self._load_seq:
+            return
+        # Stop paging this catalog; the next reload starts over.
+        self.product_model.add_page([])
+        show_error_message("Error", f"Error al cargar productos: {message}")
+
+    def _on_products_load_failed(self, request_id: int, message: str):
+        if request_id != self._load_seq:
+            return
+        self._loaded_seq = request_id
+        # Let the next filter change retry the query.
+        self._loaded_filters = None
+        self._clear_busy_cursor()
+        show_error_message("Error", f"Error al cargar productos: {message}")
+
+    def _cancel_pending_loads(self):
+        """Ignore results of in-flight loads and drop any scheduled reload."""
+        self._reload_timer.stop()
+        self._load_seq += 1
+        self._loaded_seq = self._load_seq
+        self._clear_busy_cursor()
+
+    def _show_busy_cursor(self):
+        if not self._busy_cursor_shown:
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            self._busy_cursor_shown = True
 
-            # Clear existing rows
-            self.product_table.setRowCount(0)
-            self.product_table.setRowCount(len(products))
-
-            for row, product in enumerate(products):
-                logger.debug(f"Adding row {row}: Product ID={product.id}")
-
-                try:
-                    self.product_table.setItem(
-                        row, 0, NumericTableWidgetItem(product.id)
-                    )
-                    self.product_table.setItem(row, 1, QTableWidgetItem(product.name))
-                    self.product_table.setItem(
-                        row, 2, QTableWidgetItem(product.description or "")
-                    )
-                    self.product_table.setItem(
-                        row,
-                        3,
-                        QTableWidgetItem(product.category_name or "Sin Categoría"),
-                    )
-                    status_text = "Activo" if product.is_active else "Archivado"
-                    self.product_table.setItem(row, 4, QTableWidgetItem(status_text))
-                    self.product_table.setItem(
-                        row,
-                        5,
-                        PriceTableWidgetItem(
-                            float(product.cost_price) if product.cost_price else 0,
-                            format_price,
-                        ),
-                    )
-                    self.product_table.setItem(
-                        row,
-                        6,
-                        PriceTableWidgetItem(
-                            float(product.sell_price) if product.sell_price else 0,
-                            format_price,
-                        ),
-                    )
-                    self.product_table.setItem(
-                        row,
-                        7,
-                        PercentageTableWidgetItem(
-                            float(product.calculate_profit_margin())
-                        ),
-                    )
+    def _clear_busy_cursor(self):
+        self._busy_cursor_timer.stop()
+        if self._busy_cursor_shown:
+            QApplication.restoreOverrideCursor()
+            self._busy_cursor_shown = False
 
-                    # Create action buttons
-                    actions_widget = QWidget()
-                    actions_layout = QHBoxLayout(actions_widget)
-                    actions_layout.setContentsMargins(0, 0, 0, 0)
-                    actions_layout.setSpacing(6)
-                    actions_layout.setAlignment(Qt.AlignCenter)
-
-                    edit_button = QPushButton("Editar")
-                    edit_button.setFixedWidth(80)
-                    edit_button.setFixedHeight(24)
-                    edit_button.setStyleSheet("padding: 2px 8px;")
-                    edit_button.clicked.connect(
-                        lambda _, p=product: self.edit_product(p)
-                    )
+    def _on_sort_changed(self, column: int, order: Qt.SortOrder) -> None:
+        """Load every matching product unless the table is sorted by ID."""
+        in_page_order = column == 0 and order == Qt.SortOrder.AscendingOrder
+        self.product_model.set_fetch_all(not in_page_order)
 
-                    delete_label = "Eliminar" if product.is_active else "Restaurar"
-                    delete_button = QPushButton(delete_label)
-                    delete_button.setFixedWidth(80)
-                    delete_button.setFixedHeight(24)
-                    delete_button.setStyleSheet("padding: 2px 8px;")
-                    delete_button.clicked.connect(
-                        lambda _, p=product: self.delete_product(p)
-                    )
+    def _product_at(self, proxy_row: int) -> Optional[Product]:
+        # Map the (possibly sorted) view row straight to the model's product.
+        source_index = self.product_proxy.mapToSource(
+            self.product_proxy.index(proxy_row, 0)
+        )
+        if not source_index.isValid():
+            return None
+        return self.product_model.product_at(source_index.row())
 
-                    actions_layout.addWidget(edit_button)
-                    actions_layout.addWidget(delete_button)
-                    self.product_table.setCellWidget(row, 8, actions_widget)
-                    self.product_table.setRowHeight(row, 36)
-                except Exception as e:
-                    logger.error(f"Error updating row {row}: {str(e)}")
-                    continue
-
-            # Adjust table display
-            self.product_table.resizeColumnsToContents()
-            self.product_table.horizontalHeader().setSectionResizeMode(
-                8, QHeaderView.ResizeMode.Stretch
+    def on_action_button_clicked(self, row: int, position: int):
+        product = self._product_at(row)
+        if product is None:
+            return
+        if position == 0:
+            self.edit_product(product)
+        else:
+            self.delete_product(product)
+
+    def _product_dialog(
+        self, product: Optional[Product], categories: List[Category]
+    ) -> EditProductDialog:
+        # One dialog is built lazily and repopulated for every add or edit.
+        if self._edit_dialog is None:
+            self._edit_dialog = EditProductDialog(product, categories, self)
+        else:
+            self._edit_dialog.reset(product, categories)
+        return self._edit_dialog
+
+    def _confirm(self, title: str, text: str) -> bool:
+        # One question box is built lazily and reused for every confirmation.
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Icon.Question)
+            self._confirm_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
-
-            logger.info("Product table updated successfully")
-        except Exception as e:
-            logger.error(f"Error updating product table: {str(e)}")
-            raise UIException(f"Error al actualizar la tabla de productos: {str(e)}")
-        finally:
-            QApplication.restoreOverrideCursor()
+            self._confirm_box.setDefaultButton(QMessageBox.StandardButton.No)
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        return self._confirm_box.exec() == QMessageBox.StandardButton.Yes
 
     @ui_operation(show_dialog=True)
     @handle_exceptions(
@@ -407,8 +556,7 @@ class ProductView(QWidget):
     )
     def add_product(self):
         try:
-            categories = self.category_service.get_all_categories()
-            dialog = EditProductDialog(None, categories, self)
+            dialog = self._product_dialog(None, self._categories)
             if dialog.exec():
                 product_data = dialog.product_data
                 logger.debug("Creating new product", extra={"data": product_data})
@@ -416,12 +564,7 @@ class ProductView(QWidget):
                 logger.debug(f"Product created with ID: {product_id}")
 
                 if product_id is not None:
-                    # Get fresh data but maintain filters
-                    fresh_products = self.product_service.get_all_products(
-                        active_only=not self.show_archived_checkbox.isChecked()
-                    )
-                    self.filter_products(products=fresh_products)
-
+                    # The product_added event patches the new row into the table.
                     show_info_message("Éxito", "Producto agregado exitosamente.")
                     logger.info(f"Product added successfully: ID {product_id}")
                 else:
@@ -436,38 +579,27 @@ class ProductView(QWidget):
     )
     def edit_product(self, product: Optional[Product] = None):
         if product is None:
+            # The row's Product is kept current by the product events.
             selected_rows = self.product_table.selectionModel().selectedRows()
-            if not selected_rows:
+            product = (
+                self._product_at(selected_rows[0].row()) if selected_rows else None
+            )
+            if product is None:
                 raise ValidationException(
                     "No se seleccionó ningún producto para editar."
                 )
-            row = selected_rows[0].row()
-            product_id = int(self.product_table.item(row, 0).text())
-            product = self.product_service.get_product(product_id)
-
-        if product:
-            categories = self.category_service.get_all_categories()
-            dialog = EditProductDialog(product, categories, self)
-            if dialog.exec():
-                product_data = dialog.product_data
-                try:
-                    self.product_service.update_product(product.id, product_data)
-
-                    # Get fresh data but maintain current filter
-                    fresh_products = self.product_service.get_all_products(
-                        active_only=not self.show_archived_checkbox.isChecked()
-                    )
-                    self.filter_products(products=fresh_products)
 
-                    show_info_message("Éxito", "Producto actualizado exitosamente.")
-                    logger.info(f"Product updated successfully: ID {product.id}")
-                except Exception as e:
-                    logger.error(f"Error updating product: {str(e)}")
-                    raise
-        else:
-            raise ValidationException(
-                f"No se encontró el producto con ID {product_id}."
-            )
+        dialog = self._product_dialog(product, self._categories)
+        if dialog.exec():
+            product_data = dialog.product_data
+            try:
+                # The product_updated event patches the edited row in place.
+                self.product_service.update_product(product.id, product_data)
+                show_info_message("Éxito", "Producto actualizado exitosamente.")
+                logger.info(f"Product updated successfully: ID {product.id}")
+            except Exception as e:
+                logger.error(f"Error updating product: {str(e)}")
+                raise
 
     @ui_operation(show_dialog=True)
     @handle_exceptions(
@@ -478,15 +610,10 @@ class ProductView(QWidget):
             is_active = product.is_active
             title_text = "Archivar Producto" if is_active else "Restaurar Producto"
             action_text = "archivar" if is_active else "restaurar"
-            reply = QMessageBox.question(
-                self,
+            if self._confirm(
                 title_text,
                 f"¿Está seguro que desea {action_text} el producto {product.name}?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
-            )
-
-            if reply == QMessageBox.StandardButton.Yes:
+            ):
                 QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
                 try:
                     if is_active:
@@ -496,11 +623,6 @@ class ProductView(QWidget):
                         self.product_service.restore_product(product.id)
                         show_info_message("Éxito", "Producto restaurado exitosamente.")
 
-                    # Get fresh data but maintain filters
-                    fresh_products = self.product_service.get_all_products(
-                        active_only=not self.show_archived_checkbox.isChecked()
-                    )
-                    self.filter_products(products=fresh_products)
                     logger.info(
                         "Product status updated",
                         extra={"product_id": product.id, "is_active": not is_active},
@@ -516,95 +638,137 @@ class ProductView(QWidget):
         ValidationException, DatabaseException, UIException, show_dialog=True
     )
     def search_products(self):
-        try:
-            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-            search_term = self.search_input.text().strip()
-            search_term = validate_string(search_term, max_length=100)
-            # Get fresh data and apply new search
-            fresh_products = self.product_service.get_all_products(
-                active_only=not self.show_archived_checkbox.isChecked()
-            )
-            self.filter_products(products=fresh_products, search_term=search_term)
-        finally:
-            QApplication.restoreOverrideCursor()
+        self._search_timer.stop()
+        search_term = self.search_input.text().strip()
+        search_term = validate_string(search_term, max_length=100)
+        self.filter_products(search_term=search_term)
+        self._load_name_suggestions(search_term)
+
+    def _load_name_suggestions(self, search_term: str) -> None:
+        """Fetch the names offered by the search completer off the UI thread."""
+        self._suggestion_seq += 1
+        if not search_term:
+            self._name_suggestions.setStringList([])
+            return
+        worker = QueryWorker(
+            self._suggestion_seq,
+            self.product_service.get_product_names,
+            search_term,
+            NAME_SUGGESTION_LIMIT,
+            active_only=not self.show_archived_checkbox.isChecked(),
+        )
+        worker.signals.finished.connect(self._on_name_suggestions_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_name_suggestions_loaded(self, request_id: int, names: object):
+        # Suggestions for a term the user has since changed are dropped.
+        if request_id == self._suggestion_seq:
+            self._name_suggestions.setStringList(cast(List[str], names))
 
     @ui_operation(show_dialog=True)
     @handle_exceptions(
         ValidationException, DatabaseException, UIException, show_dialog=True
     )
-    def filter_products(
-        self,
-        products: Optional[List[Product]] = None,
-        search_term: Optional[str] = None,
-    ):
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        try:
-            # Store current search term if none provided
-            if search_term is None:
-                search_term = self.search_input.text().strip()
-
-            # Only fetch all products if no products were provided
-            if products is None:
-                products = (
-                    self.product_service.get_all_products(
-                        active_only=not self.show_archived_checkbox.isChecked()
-                    )
-                    or []
-                )
-
-            search_term = search_term.lower()
-
-            # First apply category filter
-            if self.current_category_id is not None:
-                products = [
-                    p for p in products if p.category_id == self.current_category_id
-                ]
-
-            # Then apply search filter
-            if search_term:
-                products = [
-                    p
-                    for p in products
-                    if search_term in p.name.lower()
-                    or (p.description and search_term in p.description.lower())
-                ]
-
-            self.update_product_table(products)
-            logger.info(f"Products filtered: {len(products)} results")
-        finally:
-            QApplication.restoreOverrideCursor()
+    def filter_products(self, search_term: Optional[str] = None):
+        """
+        Apply the search term (if given) and the current category filter.
+
+        Matching happens in SQL: the rows are paged in again only when the
+        search term, category or archive toggle changed since the last load.
+        """
+        if search_term is not None:
+            self._search_term = search_term
+
+        if self._loaded_filters != (
+            self._search_term,
+            self.current_category_id,
+            not self.show_archived_checkbox.isChecked(),
+        ):
+            self._load_product_pages()
+
+        self.product_proxy.set_filters(self._search_term, self.current_category_id)
+        logger.info(f"Products filtered: {self.product_proxy.rowCount()} results")
 
     def refresh(self):
         """Refresh the product view while maintaining current filters."""
         try:
-            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-            fresh_products = self.product_service.get_all_products(
-                active_only=not self.show_archived_checkbox.isChecked()
-            )
-            self.filter_products(products=fresh_products)
+            self.load_products()
         except Exception as e:
             logger.error(f"Error in refresh: {str(e)}")
             show_error_message("Error", "Falló al actualizar lista de productos")
-        finally:
-            QApplication.restoreOverrideCursor()
 
-    def on_product_deleted(self, product_id: int):
-        """Handle product deleted event gracefully."""
+    def on_product_changed(self, product_id: Any) -> None:
+        """
+        Patch the table row for a product added, updated or archived elsewhere.
+
+        Only the affected product is fetched; anything unexpected falls back
+        to a full reload.
+        """
+        if not isinstance(product_id, int) or self.is_loading:
+            # A pending load would overwrite the patch; fetch a fresh one.
+            self.load_products()
+            return
         try:
-            logger.info(f"Product deleted event received: {product_id}")
-            # Simply refresh the view - don't try to access the deleted product
-            self.refresh()
+            product = self.product_service.get_product(product_id)
+            if product is None or (
+                not product.is_active and not self.show_archived_checkbox.isChecked()
+            ):
+                self.product_model.remove_product(product_id)
+            else:
+                self.product_model.upsert_product(product)
         except Exception as e:
-            logger.error(f"Error handling product deletion: {str(e)}")
-            # Don't raise the exception - just log it
+            logger.error(f"Error patching product {product_id}: {str(e)}")
+            self.load_products()
+
+    def _event_handlers(self):
+        return (
+            (event_system.product_added, self.on_product_changed),
+            (event_system.product_updated, self.on_product_changed),
+            (event_system.product_deleted, self.on_product_deleted),
+            (event_system.category_added, self.on_categories_changed),
+            (event_system.category_updated, self.on_categories_changed),
+            (event_system.category_deleted, self.on_categories_changed),
+        )
+
+    @contextmanager
+    def _bulk_update(self) -> Iterator[None]:
+        """
+        Ignore catalog events while a batch of writes runs, then reload once.
+
+        Use this around bulk operations (e.g. imports) so N product events do
+        not turn into N table patches or reloads.
+        """
+        for signal, handler in self._event_handlers():
+            signal.disconnect(handler)
+        try:
+            yield
+        finally:
+            for signal, handler in self._event_handlers():
+                signal.connect(handler)
+            self.load_products()
+
+    def on_product_deleted(self, product_id: Any) -> None:
+        """
+        Drop an archived product's row without querying it again.
+
+        Archived rows are only refetched when the view shows them, so their
+        status and actions can change in place.
+        """
+        if (
+            isinstance(product_id, int)
+            and not self.is_loading
+            and not self.show_archived_checkbox.isChecked()
+        ):
+            self.product_model.remove_product(product_id)
+            return
+        self.on_product_changed(product_id)
 
     @ui_operation(show_dialog=True)
     @handle_exceptions(DatabaseException, UIException, show_dialog=True)
     def manage_categories(self):
+        # Category events refresh the filter and the table while it is open.
         dialog = CategoryManagementDialog(self)
         if dialog.exec():
-            self.load_categories()
-            self.load_products()
             logger.info("Categories managed successfully")
 
     def show_context_menu(self, position):
@@ -613,15 +777,14 @@ class ProductView(QWidget):
             if row < 0:  # No valid row selected
                 return
 
-            product_id = int(self.product_table.item(row, 0).text())
-            product = self.product_service.get_product(product_id)
+            product = self._product_at(row)
             if product is None:
-                raise NotFoundException(f"Product with ID {product_id} not found.")
+                return
 
             menu = QMenu()
             edit_action = menu.addAction("Editar")
             delete_action = menu.addAction(
-                "Eliminar" if product.is_active else "Restaurar"
+                DELETE_ACTION_TEXT if product.is_active else RESTORE_ACTION_TEXT
             )
             refresh_action = menu.addAction("Actualizar")
 
@@ -631,7 +794,7 @@ class ProductView(QWidget):
             elif action == delete_action:
                 self.delete_product(product)
             elif action == refresh_action:
-                self.filter_products()
+                self.refresh()
         except Exception as e:
             logger.error(f"Error showing context menu: {str(e)}")
             show_error_message("Error", "Error al mostrar el menú contextual")
@@ -656,10 +819,8 @@ class ProductView(QWidget):
             if event.key() == Qt.Key.Key_Delete:
                 selected_rows = self.product_table.selectionModel().selectedRows()
                 if selected_rows:
-                    row = selected_rows[0].row()
-                    product_id = int(self.product_table.item(row, 0).text())
                     try:
-                        product = self.product_service.get_product(product_id)
+                        product = self._product_at(selected_rows[0].row())
                         if product:
                             self.delete_product(product)
                     except Exception as e:
@@ -677,8 +838,8 @@ class ProductView(QWidget):
         """Cleanup resources when the widget is being destroyed."""
         try:
             # Disconnect from event system
-            event_system.product_added.disconnect(self.load_products)
-            event_system.product_updated.disconnect(self.load_products)
-            event_system.product_deleted.disconnect(self.load_products)
+            for signal, handler in self._event_handlers():
+                signal.disconnect(handler)
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
+        self._cancel_pending_loads()
@@ -0,0 +1,368 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    Signal,
+)
+
+from models.product import Product
+from utils.helpers import format_price
+
+PRODUCT_HEADERS = (
+    "ID",
+    "Nombre",
+    "Descripción",
+    "Categoría",
+    "Estado",
+    "Precio Costo",
+    "Precio Venta",
+    "Margen Ganancia",
+    "Acciones",
+)
+ACTIONS_COLUMN = 8
+PRODUCT_COLUMN_WIDTHS = {
+    0: 60,
+    1: 220,
+    2: 240,
+    3: 140,
+    4: 90,
+    5: 110,
+    6: 110,
+    7: 130,
+}
+NO_CATEGORY_TEXT = "Sin Categoría"
+ACTIVE_STATUS_TEXT = "Activo"
+ARCHIVED_STATUS_TEXT = "Archivado"
+EDIT_ACTION_TEXT = "Editar"
+DELETE_ACTION_TEXT = "Eliminar"
+RESTORE_ACTION_TEXT = "Restaurar"
+# Button labels for the actions column, painted by ActionButtonsDelegate.
+ACTION_LABELS_ROLE = Qt.ItemDataRole.UserRole
+ACTIVE_ACTIONS = (EDIT_ACTION_TEXT, DELETE_ACTION_TEXT)
+ARCHIVED_ACTIONS = (EDIT_ACTION_TEXT, RESTORE_ACTION_TEXT)
+
+# Rows pulled from the database each time the view scrolls near the end.
+PRODUCT_PAGE_SIZE = 200
+
+_NUMERIC_COLUMNS = (0, 5, 6, 7)
+_NUMERIC_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+def format_margin(value: float) -> str:
+    """Format a profit margin percentage with a decimal comma."""
+    return f"{value:.2f}%".replace(".", ",")
+
+
+class ProductTableModel(QAbstractTableModel):
+    """
+    Read-only table model serving products to a QTableView on demand.
+
+    Rows come either from `set_products` or page by page from a paged source
+    given to `set_page_source`; in the latter case the view pulls further
+    pages through `canFetchMore`/`fetchMore` as the user scrolls, or the
+    model loads them all after `set_fetch_all(True)`.
+    """
+
+    # Emitted by fetchMore when the page source is asynchronous; the receiver
+    # answers with add_page().
+    page_requested = Signal(int, int)  # last loaded product id, limit
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._products: List[Product] = []
+        self._display: List[tuple] = []
+        self._sort_values: List[tuple] = []
+        self._action_labels: List[tuple] = []
+        self._filter_keys: List[Tuple[Optional[int], str]] = []
+        self._row_by_id: Dict[int, int] = {}
+        self._paged = False
+        self._fetch_page: Optional[Callable[[int, int], List[Product]]] = None
+        self._page_pending = False
+        self._fetch_all = False
+        self._last_id = 0
+        self._fetched = 0
+        self._total = 0
+
+    def set_products(self, products: Sequence[Product]) -> None:
+        """Replace all rows, formatting each product once."""
+        self.beginResetModel()
+        self._clear()
+        self._paged = False
+        self._fetch_page = None
+        self._page_pending = False
+        for product in products:
+            self._append_product(product)
+        self._fetched = self._total = len(self._products)
+        self.endResetModel()
+
+    def set_page_source(
+        self,
+        fetch_page: Optional[Callable[[int, int], List[Product]]],
+        total: int,
+        first_page: Optional[Sequence[Product]] = None,
+    ) -> None:
+        """
+        Replace all rows with a paged source of `total` products.
+
+        With `fetch_page(after_id, limit)` pages are fetched synchronously; with
+        None, `page_requested` is emitted instead and the rows arrive through
+        `add_page`. Only the first page is loaded here, either from
+        `first_page` when the caller already fetched it or from the source.
+        """
+        self.beginResetModel()
+        self._clear()
+        self._paged = True
+        self._fetch_page = fetch_page
+        self._page_pending = False
+        self._total = total
+        for product in first_page or ():
+            self._append_product(product)
+        self._last_id = max((product.id for product in self._products), default=0)
+        self._fetched = len(self._products)
+        self.endResetModel()
+        if first_page is None and self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+        else:
+            self._fetch_remaining()
+
+    def set_fetch_all(self, fetch_all: bool) -> None:
+        """
+        Choose whether to load every page of the paged source right away.
+
+        A sorting proxy can only order the rows already loaded, so the view
+        turns this on for any order other than the ID order pages come in.
+        """
+        self._fetch_all = fetch_all
+        self._fetch_remaining()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid() or not self._paged or self._page_pending:
+            return False
+        return self._fetched < self._total
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        if self._fetch_page is None:
+            self._page_pending = True
+            self.page_requested.emit(self._last_id, PRODUCT_PAGE_SIZE)
+            return
+        self.add_page(self._fetch_page(self._last_id, PRODUCT_PAGE_SIZE))
+
+    def add_page(self, page: Sequence[Product]) -> None:
+        """Append the next page of the paged source."""
+        self._page_pending = False
+        if not page:
+            # The source shrank since it was counted; stop asking for more.
+            self._total = self._fetched
+            return
+        self._fetched += len(page)
+        self._last_id = max(self._last_id, max(product.id for product in page))
+        # Rows already patched in by upsert_product are not added twice.
+        page = [product for product in page if product.id not in self._row_by_id]
+        if page:
+            first = len(self._products)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            for product in page:
+                self._append_product(product)
+            self.endInsertRows()
+        self._fetch_remaining()
+
+    def _fetch_remaining(self) -> None:
+        # Called after each page, so an asynchronous source has at most one
+        # request in flight.
+        if self._fetch_all and self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def upsert_product(self, product: Product) -> None:
+        """Patch the row for `product` in place, or append it if it is new."""
+        row = self._row_by_id.get(product.id)
+        if row is None:
+            row = len(self._products)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._append_product(product)
+            self.endInsertRows()
+            return
+        display, sort_values = self._build_row(product)
+        self._products[row] = product
+        self._display[row] = display
+        self._sort_values[row] = sort_values
+        self._action_labels[row] = self._actions_for(product)
+        self._filter_keys[row] = self._filter_key_for(product)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(PRODUCT_HEADERS) - 1)
+        )
+
+    def remove_product(self, product_id: int) -> bool:
+        """
+        Drop the row for `product_id`.
+
+        Returns:
+            bool: False if the product is not currently loaded in the model.
+        """
+        row = self._row_by_id.get(product_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._products[row]
+        del self._display[row]
+        del self._sort_values[row]
+        del self._action_labels[row]
+        del self._filter_keys[row]
+        self._row_by_id = {
+            product.id: index for index, product in enumerate(self._products)
+        }
+        # Keep the row count aligned with the source, which lost this row.
+        if self._paged and self._fetched > 0:
+            self._fetched -= 1
+            self._total -= 1
+        self.endRemoveRows()
+        return True
+
+    def filter_key_at(self, row: int) -> Tuple[Optional[int], str]:
+        """
+        Return the category id and lowercase search text of a row.
+
+        Both are built when the row is loaded, so filtering never touches the
+        Product objects.
+        """
+        return self._filter_keys[row]
+
+    def product_at(self, row: int) -> Optional[Product]:
+        """Return the product backing a model row, if any."""
+        if 0 <= row < len(self._products):
+            return self._products[row]
+        return None
+
+    def _clear(self) -> None:
+        self._products = []
+        self._display = []
+        self._sort_values = []
+        self._action_labels = []
+        self._filter_keys = []
+        self._row_by_id = {}
+
+    def _append_product(self, product: Product) -> None:
+        self._row_by_id[product.id] = len(self._products)
+        self._products.append(product)
+        display, sort_values = self._build_row(product)
+        self._display.append(display)
+        self._sort_values.append(sort_values)
+        self._action_labels.append(self._actions_for(product))
+        self._filter_keys.append(self._filter_key_for(product))
+
+    @staticmethod
+    def _filter_key_for(product: Product) -> Tuple[Optional[int], str]:
+        # A newline cannot appear in a search term, so matches never span
+        # the name and the description.
+        search_text = f"{product.name}\n{product.description or ''}".lower()
+        return product.category_id, search_text
+
+    @staticmethod
+    def _actions_for(product: Product) -> tuple:
+        return ACTIVE_ACTIONS if product.is_active else ARCHIVED_ACTIONS
+
+    @staticmethod
+    def _build_row(product: Product) -> tuple:
+        margin = float(product.calculate_profit_margin())
+        display = (
+            str(product.id),
+            product.name,
+            product.description or "",
+            product.category_name or NO_CATEGORY_TEXT,
+            ACTIVE_STATUS_TEXT if product.is_active else ARCHIVED_STATUS_TEXT,
+            format_price(product.cost_price or 0),
+            format_price(product.sell_price or 0),
+            format_margin(margin),
+            "",
+        )
+        # Same layout as `display`, with raw numbers in the numeric columns.
+        sort_values = (
+            product.id,
+            *display[1:5],
+            product.cost_price or 0,
+            product.sell_price or 0,
+            margin,
+            "",
+        )
+        return display, sort_values
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._products)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(PRODUCT_HEADERS)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.row()][column]
+        if role == Qt.ItemDataRole.EditRole:
+            # Raw numbers so the proxy sorts IDs, prices and margins numerically.
+            return self._sort_values[index.row()][column]
+        if role == ACTION_LABELS_ROLE and column == ACTIONS_COLUMN:
+            return self._action_labels[index.row()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and column in _NUMERIC_COLUMNS:
+            return _NUMERIC_ALIGNMENT
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return PRODUCT_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ProductFilterProxyModel(QSortFilterProxyModel):
+    """Sorting proxy that also filters products by search term and category."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_term = ""
+        self._category_id: Optional[int] = None
+        self.setSortRole(Qt.ItemDataRole.EditRole)
+
+    def set_filters(self, search_term: str, category_id: Optional[int]) -> None:
+        """Apply a case-insensitive name/description search and a category."""
+        search_term = search_term.lower()
+        if search_term == self._search_term and category_id == self._category_id:
+            return
+        self.beginFilterChange()
+        self._search_term = search_term
+        self._category_id = category_id
+        self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+
+    def filterAcceptsRow(
+        self, source_row: int, source_parent: QModelIndex | QPersistentModelIndex
+    ) -> bool:
+        if not self._search_term and self._category_id is None:
+            # No filter active (the common case): skip the row lookup.
+            return True
+        model = self.sourceModel()
+        if not isinstance(model, ProductTableModel):
+            return True
+        category_id, search_text = model.filter_key_at(source_row)
+        if self._category_id is not None and category_id != self._category_id:
+            return False
+        return self._search_term in search_text
@@ -27,7 +27,7 @@ from PySide6.QtWidgets import (
 )
 
 from models.purchase import Purchase
-from services.product_service import ProductService
+from services.product_service import product_service
 from services.purchase_service import PurchaseService
 from utils.decorators import handle_exceptions, ui_operation
 from utils.exceptions import DatabaseException, UIException, ValidationException
@@ -130,7 +130,7 @@ class PurchaseView(QWidget):
     def __init__(self):
         super().__init__()
         self.purchase_service = PurchaseService()
-        self.product_service = ProductService()
+        self.product_service = product_service
         self.setup_ui()
         self.setup_scan_sound()
 
@@ -442,7 +442,7 @@ class PurchaseView(QWidget):
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         try:
             purchases = self.purchase_service.get_all_purchases()
-            QTimer.singleShot(0, lambda: self.update_purchase_table(purchases))
+            QTimer.singleShot(0, self, lambda: self.update_purchase_table(purchases))
             logger.info(f"Loaded {len(purchases)} purchases")
         except Exception as e:
             logger.error(f"Error loading purchases: {str(e)}")
@@ -450,7 +450,7 @@ class PurchaseView(QWidget):
         finally:
             QApplication.restoreOverrideCursor()
             self.progress_bar.setValue(100)
-            QTimer.singleShot(1000, lambda: self.progress_bar.setVisible(False))
+            QTimer.singleShot(1000, self, lambda: self.progress_bar.setVisible(False))
 
     def search_products(self):
         """Search for products manually."""
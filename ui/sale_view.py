@@ -31,8 +31,8 @@ from models.customer import Customer
 from models.product import Product
 from models.sale import Sale
 from services.customer_service import CustomerService
-from services.inventory_service import InventoryService
-from services.product_service import ProductService
+from services.inventory_service import inventory_service
+from services.product_service import ProductService, product_service
 from services.sale_service import SaleService
 from ui.styles import DesignTokens
 from ui.sale_view_support import (
@@ -351,7 +351,6 @@ class SaleItemDialog(QDialog):
 
         # Check stock for low stock warning
         try:
-            inventory_service = InventoryService()
             inventory = inventory_service.get_inventory(self.product.id)
             current_stock = inventory.quantity if inventory else 0.0
             if current_stock < 10:
@@ -500,7 +499,7 @@ class SaleView(QWidget):
         super().__init__()
         self.sale_service = SaleService()
         self.customer_service = CustomerService()
-        self.product_service = ProductService()
+        self.product_service = product_service
         self.settings = QSettings(COMPANY_NAME, APP_NAME)
         self.setup_ui()
         self.setup_scan_sound()
@@ -756,7 +755,6 @@ class SaleView(QWidget):
                 if self.quick_scan_checkbox.isChecked():
                     # Check stock for warning
                     try:
-                        inventory_service = InventoryService()
                         inventory = inventory_service.get_inventory(product.id)
                         current_stock = inventory.quantity if inventory else 0.0
                         if current_stock < 10:
@@ -1024,7 +1022,7 @@ class SaleView(QWidget):
         try:
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
             sales = self.sale_service.get_all_sales()
-            QTimer.singleShot(0, lambda: self.update_sale_table(sales))
+            QTimer.singleShot(0, self, lambda: self.update_sale_table(sales))
             logger.info(f"Loaded {len(sales)} sales")
         except Exception as e:
             logger.error(f"Error loading sales: {str(e)}")
@@ -4,7 +4,7 @@ from models.customer import Customer
 from models.product import Product
 from utils.exceptions import ValidationException
 from utils.math.financial_calculator import FinancialCalculator
-from utils.system.logger import logger
+from utils.system.logger import LogLevel, logger
 
 CustomerChooser = Callable[[List[Customer]], Optional[Customer]]
 
@@ -98,15 +98,16 @@ def resolve_customer_by_identifier(
             "Customers found for short identifier",
             extra={"identifier": identifier, "count": len(customers)},
         )
-        for customer in customers:
-            logger.debug(
-                "Customer candidate for sale selection",
-                extra={
-                    "customer_id": customer.id,
-                    "identifier_9": customer.identifier_9,
-                    "identifier_3or4": customer.identifier_3or4,
-                },
-            )
+        if logger.isEnabledFor(LogLevel.DEBUG):
+            for customer in customers:
+                logger.debug(
+                    "Customer candidate for sale selection",
+                    extra={
+                        "customer_id": customer.id,
+                        "identifier_9": customer.identifier_9,
+                        "identifier_3or4": customer.identifier_3or4,
+                    },
+                )
 
         unique_customers = deduplicate_customers_by_phone(customers)
         if len(unique_customers) == 1:
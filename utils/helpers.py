@@ -1,8 +1,17 @@
 import datetime
 from decimal import Decimal
-from typing import Any, Callable, List, Optional, TypeVar, Union
-
-from PySide6.QtWidgets import QHeaderView, QMessageBox, QTableWidget, QWidget
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from PySide6.QtCore import QAbstractItemModel, QObject, Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import (
+    QHeaderView,
+    QMessageBox,
+    QTableView,
+    QTableWidget,
+    QWidget,
+)
 
 from utils.exceptions import ValidationException
 from utils.system.logger import logger
@@ -38,6 +47,62 @@ def create_table(headers: List[str]) -> QTableWidget:
         raise
 
 
+def create_combo_model(
+    items: Sequence[Tuple[str, Any]], parent: Optional[QObject] = None
+) -> QStandardItemModel:
+    """
+    Build a complete QComboBox model from (text, data) pairs.
+
+    Handing a combo the finished model with `setModel` fills it in one step,
+    instead of one `addItem` call (and model insertion) per entry.
+
+    Args:
+        items (Sequence[Tuple[str, Any]]): Display text and user data per entry.
+        parent (Optional[QObject]): Owner of the model, usually the combo.
+
+    Returns:
+        QStandardItemModel: The model, with the data under UserRole.
+    """
+    model = QStandardItemModel(parent)
+    rows = []
+    for text, data in items:
+        item = QStandardItem(text)
+        item.setData(data, Qt.ItemDataRole.UserRole)
+        rows.append(item)
+    model.invisibleRootItem().appendRows(rows)
+    return model
+
+
+def create_table_view(model: QAbstractItemModel) -> QTableView:
+    """
+    Create and return a QTableView bound to the specified model.
+
+    The view is configured like the tables returned by `create_table`, but rows
+    are served lazily by the model instead of being stored as table items.
+
+    Args:
+        model (QAbstractItemModel): The model (or proxy model) to display.
+
+    Returns:
+        QTableView: A configured table view displaying the model.
+    """
+    try:
+        table = QTableView()
+        table.setModel(model)
+        table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Interactive
+        )
+        table.horizontalHeader().setStretchLastSection(True)
+        table.setSortingEnabled(True)
+        table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        logger.debug(f"Created table view with {model.columnCount()} columns")
+        return table
+    except Exception as e:
+        logger.error(f"Error creating table view: {str(e)}")
+        raise
+
+
 def show_message(
     title: str, message: str, icon: QMessageBox.Icon = QMessageBox.Icon.Information
 ) -> None:
@@ -169,10 +234,13 @@ def truncate_string(text: str, max_length: int, ellipsis: str = "...") -> str:
     return text[: max_length - len(ellipsis)] + ellipsis
 
 
+@lru_cache(maxsize=4096)
 def format_price(amount: Union[int, float, Decimal]) -> str:
     """
     Format a price with dot as thousand separator and no decimals.
 
+    Results are memoized: catalogs repeat the same price points many times.
+
     Args:
         amount (Union[int, float, Decimal]): The price amount to format.
 
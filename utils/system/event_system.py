@@ -27,7 +27,7 @@ except ImportError:
                     # Signal emission propagates exceptions in direct connection mode
                     raise e
 
-        def connect(self, slot):
+        def connect(self, slot, connection_type=None):
             logger.debug(f"MockSignal connected: {slot}")
             self._slots.append(slot)
 
@@ -137,19 +137,29 @@ class EventSystem(QObject):
             logger.error(f"Unknown event: {event_name}")
             raise ValueError(f"Unknown event: {event_name}")
 
-    def connect_to_event(self, event_name: str, slot: Callable[..., None]) -> None:
+    def connect_to_event(
+        self,
+        event_name: str,
+        slot: Callable[..., None],
+        connection_type: Optional[Any] = None,
+    ) -> None:
         """
         Connect a slot (callback function) to a specific event.
 
         Args:
             event_name (str): The name of the event to connect to.
             slot (Callable[..., None]): The function to be called when the event is emitted.
+            connection_type (Optional[Qt.ConnectionType]): Connection type to use
+                instead of Qt's automatic choice.
 
         Raises:
             ValueError: If the event_name is not recognized.
         """
         if event_name in self._signal_map:
-            self._signal_map[event_name].connect(slot)
+            if connection_type is None:
+                self._signal_map[event_name].connect(slot)
+            else:
+                self._signal_map[event_name].connect(slot, connection_type)
             logger.debug(
                 f"Connected to event: {event_name}", extra={"slot_name": slot.__name__}
             )
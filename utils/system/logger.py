@@ -60,14 +60,22 @@ class StructuredLogger:
         }
         return json.dumps(log_data)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Return whether a message at `level` would be emitted."""
+        return self._logger.isEnabledFor(level)
+
+    # Each level checks first, so disabled messages skip the JSON encoding.
     def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
-        self._logger.info(self._format_message(message, extra))
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._format_message(message, extra))
 
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
-        self._logger.debug(self._format_message(message, extra))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_message(message, extra))
 
     def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
-        self._logger.warning(self._format_message(message, extra))
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(self._format_message(message, extra))
 
     def error(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         self._logger.error(self._format_message(message, extra))
@@ -83,7 +91,8 @@ class StructuredLogger:
 
     def _log(self, level: int, message: str, **kwargs) -> None:
         """Internal method for logging with level."""
-        self._logger.log(level, self._format_message(message, kwargs))
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, self._format_message(message, kwargs))
 
 
 class JsonFormatter(logging.Formatter):
@@ -0,0 +1,40 @@
+from typing import Any, Dict, Set
+
+from PySide6.QtCore import QSettings
+
+
+class CachedSettings:
+    """
+    In-memory front for QSettings.
+
+    Values are read from the backing store once and served from memory
+    afterwards. Writes stay in memory until `flush()` is called, so frequent
+    updates (e.g. the last selected tab) do not touch the registry or the
+    settings file each time.
+    """
+
+    def __init__(self, organization: str, application: str):
+        self._settings = QSettings(organization, application)
+        self._cache: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+
+    def value(self, key: str, default: Any = None) -> Any:
+        if key not in self._cache:
+            self._cache[key] = self._settings.value(key)
+        value = self._cache[key]
+        return default if value is None else value
+
+    def setValue(self, key: str, value: Any) -> None:
+        if key in self._cache and self._cache[key] == value:
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+
+    def flush(self) -> None:
+        """Write pending changes to the backing QSettings store."""
+        if not self._dirty:
+            return
+        for key in self._dirty:
+            self._settings.setValue(key, self._cache[key])
+        self._dirty.clear()
+        self._settings.sync()
@@ -0,0 +1,90 @@
+from typing import List, Sequence
+
+from PySide6.QtCore import QEvent, QModelIndex, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
+)
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Paint a row of push buttons inside a table cell, labelled per row.
+
+    The labels are read from the model through `labels_role` as a sequence of
+    strings, so a row can show e.g. "Eliminar" or "Restaurar" depending on its
+    state. Clicks report the view row and the position of the button hit.
+    """
+
+    clicked = Signal(int, int)  # Emits the view row and the button position
+
+    BUTTON_WIDTH = 80
+    BUTTON_MARGIN = 4
+    BUTTON_SPACING = 6
+
+    def __init__(self, labels_role: int = Qt.ItemDataRole.UserRole, parent=None):
+        super().__init__(parent)
+        self.labels_role = labels_role
+        # One style option is reused for every button painted.
+        self._button = QStyleOptionButton()
+        self._button.state = (
+            QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        )
+
+    def labels(self, index: QModelIndex) -> Sequence[str]:
+        return index.data(self.labels_role) or ()
+
+    def button_rects(self, cell_rect: QRect, count: int) -> List[QRect]:
+        """Return `count` button rectangles centred as a group in `cell_rect`."""
+        if count <= 0:
+            return []
+        available = cell_rect.width() - 2 * self.BUTTON_MARGIN
+        spacing = self.BUTTON_SPACING * (count - 1)
+        width = max(0, min(self.BUTTON_WIDTH, (available - spacing) // count))
+        height = cell_rect.height() - 2 * self.BUTTON_MARGIN
+        left = cell_rect.left() + (cell_rect.width() - count * width - spacing) // 2
+        top = cell_rect.top() + self.BUTTON_MARGIN
+        return [
+            QRect(left + i * (width + self.BUTTON_SPACING), top, width, height)
+            for i in range(count)
+        ]
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        labels = self.labels(index)
+        style = option.widget.style() if option.widget else QApplication.style()
+        button = self._button
+        for label, rect in zip(labels, self.button_rects(option.rect, len(labels))):
+            button.rect = rect
+            button.text = label
+            style.drawControl(
+                QStyle.ControlElement.CE_PushButton, button, painter, option.widget
+            )
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        hint = super().sizeHint(option, index)
+        count = len(self.labels(index))
+        if count:
+            hint.setWidth(
+                count * self.BUTTON_WIDTH
+                + (count - 1) * self.BUTTON_SPACING
+                + 2 * self.BUTTON_MARGIN
+            )
+        return hint
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index):
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and isinstance(event, QMouseEvent)
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            point = event.position().toPoint()
+            rects = self.button_rects(option.rect, len(self.labels(index)))
+            for position, rect in enumerate(rects):
+                if rect.contains(point):
+                    self.clicked.emit(index.row(), position)
+                    return True
+        return super().editorEvent(event, model, option, index)
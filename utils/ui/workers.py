@@ -0,0 +1,47 @@
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from utils.system.logger import logger
+
+
+class WorkerSignals(QObject):
+    """Signals used by `QueryWorker` to hand results back to the GUI thread."""
+
+    finished = Signal(int, object)  # Emits the request id and the result
+    failed = Signal(int, str)  # Emits the request id and the error message
+
+
+class QueryWorker(QRunnable):
+    """
+    Run a blocking service call on a QThreadPool thread.
+
+    Each worker carries a request id so the receiver can drop results from
+    requests that were superseded while they were running.
+
+    The pool deletes the worker on its own thread, so `func` and its
+    arguments must not hold the last reference to a widget: pass service
+    methods, not bound methods of the view.
+    """
+
+    def __init__(
+        self, request_id: int, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ):
+        super().__init__()
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(
+                f"Background query failed: {str(e)}",
+                extra={"request_id": self.request_id},
+            )
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        self.signals.finished.emit(self.request_id, result)